@@ -16,19 +16,43 @@ Usage:
     python main.py status                  # Show system status
 """
 
+import os
 import sys
 import argparse
-import subprocess
 from pathlib import Path
 from datetime import datetime
-import json
+import numpy as np
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.config.settings import Config
-from src.pipeline.daily_update import DailyUpdatePipeline
-from src.pipeline.scheduler import create_default_scheduler
+from src.utils.fast_json import read_json
+
+# Per-candidate block of the cmd_update constituency report
+_CANDIDATE_TEMPLATE = (
+    "   {status}: {name} ({party_code})\n"
+    "      Party: {party_name}\n"
+    "      Winning Chance: {winning_chances:.1f}%\n"
+    "      Experience: {experience}\n"
+    "      Assets: {assets} | Cases: {criminal_cases}"
+)
+
+_deps_checked = False
+
+
+def _check_deps():
+    """Import core dependencies once per process, raising ImportError if any is missing"""
+    global _deps_checked
+    if _deps_checked:
+        return
+    
+    import pandas
+    import numpy
+    import sklearn
+    import streamlit
+    import plotly
+    _deps_checked = True
 
 
 def cmd_init():
@@ -60,17 +84,22 @@ def cmd_init():
     # Check dependencies
     print(f"\n📦 Checking dependencies...")
     try:
-        import pandas
-        import numpy
-        import sklearn
-        import streamlit
-        import plotly
+        _check_deps()
         print("✅ Core dependencies installed")
     except ImportError as e:
         print(f"❌ Missing dependency: {e}")
         print("   Run: pip install -r requirements.txt")
         return False
     
+    # Warm the Monte Carlo kernel so its compiled artifact is cached before the first update
+    print(f"\n⚡ Compiling Monte Carlo kernel...")
+    try:
+        from src.modeling.mc_kernel import simulate, NUMBA_AVAILABLE
+        simulate(Config.CONSTITUENCY_ZEROS, 2, 0)
+        print("✅ Monte Carlo kernel compiled and cached" if NUMBA_AVAILABLE else "⚠️  numba not installed, kernel will run uncompiled")
+    except Exception as e:
+        print(f"⚠️  Kernel warm-up skipped: {e}")
+    
     # Test basic functionality
     print(f"\n🧪 Testing basic functionality...")
     try:
@@ -110,6 +139,8 @@ def cmd_update():
     print("=" * 60)
     
     try:
+        from src.pipeline.daily_update import DailyUpdatePipeline
+        
         pipeline = DailyUpdatePipeline()
         results = pipeline.run_full_pipeline()
         
@@ -121,55 +152,42 @@ def cmd_update():
                 sim_results = results['results']['simulation']
                 
                 # Import party and candidate analysis
-                from src.data.bihar_parties import BIHAR_PARTIES, NDA_PARTIES, INDI_PARTIES, OTHER_PARTIES
+                from src.data.bihar_parties import BIHAR_PARTIES, NDA_PARTIES, INDI_PARTIES, NDA_SHARES, INDI_SHARES
                 from src.data.constituency_candidates import constituency_analyzer
                 
-                print(f"\n🏛️ DETAILED PARTY-WISE FORECAST:")
-                print(f"=" * 60)
+                # Collect the report and write it in one call
+                out = []
+                
+                out.append(f"\n🏛️ DETAILED PARTY-WISE FORECAST:")
+                out.append(f"=" * 60)
                 
                 # Individual Party Analysis
                 mean_nda = sim_results.get('mean_nda_seats', 0)
                 mean_indi = 243 - mean_nda
                 
-                print(f"\n🔵 NDA ALLIANCE ({mean_nda:.1f} seats):")
-                nda_seat_share = mean_nda / 243 * 100
-                for party in NDA_PARTIES:
+                out.append(f"\n🔵 NDA ALLIANCE ({mean_nda:.1f} seats):")
+                # Estimate party-wise seats (simplified)
+                for party, party_seats in zip(NDA_PARTIES, mean_nda * NDA_SHARES):
                     party_info = BIHAR_PARTIES[party]
-                    # Estimate party-wise seats (simplified)
-                    if party == 'BJP':
-                        party_seats = mean_nda * 0.55  # BJP gets ~55% of NDA seats
-                    elif party == 'JDU':
-                        party_seats = mean_nda * 0.35  # JDU gets ~35% of NDA seats
-                    else:
-                        party_seats = mean_nda * 0.05  # Others get ~5% each
-                    
-                    print(f"   • {party_info['full_name']} ({party}): {party_seats:.0f} seats")
-                    print(f"     Leader: {party_info['state_leader']} | Symbol: {party_info['symbol']}")
+                    out.append(f"   • {party_info['full_name']} ({party}): {party_seats:.0f} seats")
+                    out.append(f"     Leader: {party_info['state_leader']} | Symbol: {party_info['symbol']}")
                 
-                print(f"\n🔴 INDI ALLIANCE ({mean_indi:.1f} seats):")
-                for party in INDI_PARTIES:
+                out.append(f"\n🔴 INDI ALLIANCE ({mean_indi:.1f} seats):")
+                for party, party_seats in zip(INDI_PARTIES, mean_indi * INDI_SHARES):
                     party_info = BIHAR_PARTIES[party]
-                    # Estimate party-wise seats (simplified)
-                    if party == 'RJD':
-                        party_seats = mean_indi * 0.60  # RJD gets ~60% of INDI seats
-                    elif party == 'INC':
-                        party_seats = mean_indi * 0.25  # INC gets ~25% of INDI seats
-                    else:
-                        party_seats = mean_indi * 0.05  # Others get ~5% each
-                    
-                    print(f"   • {party_info['full_name']} ({party}): {party_seats:.0f} seats")
-                    print(f"     Leader: {party_info['state_leader']} | Symbol: {party_info['symbol']}")
+                    out.append(f"   • {party_info['full_name']} ({party}): {party_seats:.0f} seats")
+                    out.append(f"     Leader: {party_info['state_leader']} | Symbol: {party_info['symbol']}")
                 
-                print(f"\n⚪ OTHER PARTIES:")
+                out.append(f"\n⚪ OTHER PARTIES:")
                 for party in ['AIMIM', 'BSP', 'LJSP', 'JSP']:
                     if party in BIHAR_PARTIES:
                         party_info = BIHAR_PARTIES[party]
-                        print(f"   • {party_info['full_name']} ({party}): 0-2 seats")
-                        print(f"     Leader: {party_info['state_leader']} | Symbol: {party_info['symbol']}")
+                        out.append(f"   • {party_info['full_name']} ({party}): 0-2 seats")
+                        out.append(f"     Leader: {party_info['state_leader']} | Symbol: {party_info['symbol']}")
                 
                 # Constituency-wise Sample Analysis
-                print(f"\n🏛️ CONSTITUENCY-WISE CANDIDATE ANALYSIS:")
-                print(f"=" * 70)
+                out.append(f"\n🏛️ CONSTITUENCY-WISE CANDIDATE ANALYSIS:")
+                out.append(f"=" * 70)
                 
                 # Show sample constituencies with detailed candidate matchups
                 all_constituencies = list(constituency_analyzer.constituencies.keys())
@@ -178,38 +196,37 @@ def cmd_update():
                 for const_name in sample_constituencies:
                     matchup = constituency_analyzer.get_candidate_matchup(const_name)
                     if matchup:
-                        print(f"\n📍 {const_name.upper()} ({matchup['region']})")
-                        print(f"   Battle Type: {matchup['battle_type']}")
-                        print(f"   Key Contest: {matchup['key_contest']}")
+                        out.append(f"\n📍 {const_name.upper()} ({matchup['region']})")
+                        out.append(f"   Battle Type: {matchup['battle_type']}")
+                        out.append(f"   Key Contest: {matchup['key_contest']}")
                         
-                        print(f"   Candidates:")
+                        out.append(f"   Candidates:")
                         for i, candidate in enumerate(matchup['candidates'][:3]):  # Top 3 candidates
                             status = "🥇 Expected Winner" if i == 0 else f"🥈 Runner-up #{i}"
-                            print(f"   {status}: {candidate['name']} ({candidate['party_code']})")
-                            print(f"      Party: {candidate['party_name']}")
-                            print(f"      Winning Chance: {candidate['winning_chances']:.1f}%")
-                            print(f"      Experience: {candidate['experience']}")
-                            print(f"      Assets: {candidate['assets']} | Cases: {candidate['criminal_cases']}")
+                            out.append(_CANDIDATE_TEMPLATE.format_map({**candidate, 'status': status}))
                         
                         # Historical context
                         hist = matchup['historical_context']
-                        print(f"   Previous Winners:")
-                        print(f"      2020 Assembly: {hist['last_winner']} ({hist['last_party']})")
-                        print(f"      Margin: {hist['last_margin']:,} votes | Trend: {hist['trend']}")
+                        out.append(f"   Previous Winners:")
+                        out.append(f"      2020 Assembly: {hist['last_winner']} ({hist['last_party']})")
+                        out.append(f"      Margin: {hist['last_margin']:,} votes | Trend: {hist['trend']}")
                 
                 # Show competitive seats summary
                 if 'marginal_seats' in sim_results:
                     marginal_df = sim_results['marginal_seats']
-                    print(f"\n🔥 TOP 10 MOST COMPETITIVE CONSTITUENCIES:")
-                    print(f"=" * 80)
-                    print(f"{'Rank':<4} {'Constituency':<20} {'NDA Prob':<10} {'Status':<12} {'Region':<15}")
-                    print(f"-" * 80)
-                    for i, (_, row) in enumerate(marginal_df.head(10).iterrows()):
-                        constituency = row['constituency']
-                        prob = row['nda_win_prob']
-                        classification = row['classification']
-                        region = row.get('region', 'Unknown')
-                        print(f"{i+1:<4} {constituency:<20} {prob:.1%}{'':>4} {classification:<12} {region:<15}")
+                    out.append(f"\n🔥 TOP 10 MOST COMPETITIVE CONSTITUENCIES:")
+                    out.append(f"=" * 80)
+                    out.append(f"{'Rank':<4} {'Constituency':<20} {'NDA Prob':<10} {'Status':<12} {'Region':<15}")
+                    out.append(f"-" * 80)
+                    top = marginal_df.head(10)
+                    constituencies = top['constituency'].to_numpy()
+                    probs = top['nda_win_prob'].to_numpy()
+                    classifications = top['classification'].astype(str).to_numpy()
+                    regions = top['region'].to_numpy() if 'region' in top.columns else ['Unknown'] * len(top)
+                    for i in range(len(constituencies)):
+                        out.append(f"{i+1:<4} {constituencies[i]:<20} {probs[i]:.1%}{'':>4} {classifications[i]:<12} {regions[i]:<15}")
+                
+                sys.stdout.write('\n'.join(out) + '\n')
                 
             print(f"\n💡 Full Interactive Analysis: python main.py dashboard")
             return True
@@ -232,6 +249,8 @@ def cmd_schedule():
     print("=" * 60)
     
     try:
+        from src.pipeline.scheduler import create_default_scheduler
+        
         scheduler = create_default_scheduler(background_mode=False)
         
         print(f"\n📅 Scheduled Jobs:")
@@ -267,15 +286,14 @@ def cmd_dashboard(host="localhost", port="8501"):
         print(f"🔗 URL: http://{host}:{port}")
         print(f"\n⏹️  Press Ctrl+C to stop the dashboard")
         
-        # Run streamlit
-        result = subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
-            str(dashboard_path),
-            "--server.port", port,
-            "--server.address", host
-        ])
+        # Run streamlit in-process, reusing the already-imported interpreter
+        from streamlit.web import bootstrap
+        
+        flag_options = {'server_port': int(port), 'server_address': host}
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(dashboard_path), False, [], flag_options)
         
-        return result.returncode == 0
+        return True
         
     except KeyboardInterrupt:
         print(f"\n⏹️  Dashboard stopped by user")
@@ -378,6 +396,14 @@ def cmd_test():
         return False
 
 
+def _count_entries(path):
+    """Number of entries directly under path, 0 if it does not exist"""
+    if not path.exists():
+        return 0
+    with os.scandir(path) as entries:
+        return sum(1 for _ in entries)
+
+
 def cmd_status():
     """Show system status"""
     print("📊 Bihar Forecast System Status")
@@ -402,7 +428,7 @@ def cmd_status():
     
     for name, path in directories:
         exists = path.exists()
-        file_count = len(list(path.glob('*'))) if exists else 0
+        file_count = _count_entries(path)
         status['directories'][name] = {'exists': exists, 'file_count': file_count}
         
         status_icon = "✅" if exists else "❌"
@@ -412,22 +438,31 @@ def cmd_status():
     print(f"\n📊 Recent Data Files:")
     today = datetime.now().strftime('%Y-%m-%d')
     
-    data_checks = [
-        ('News Data', Config.RAW_DATA_DIR / f"*news*{today}*"),
-        ('Poll Data', Config.PROCESSED_DATA_DIR / f"*poll*{today}*"),
-        ('Features', Config.PROCESSED_DATA_DIR / f"features*{today}*"),
-        ('Results', Config.RESULTS_DIR / today)
-    ]
-    
-    for name, pattern in data_checks:
-        if isinstance(pattern, Path):
-            exists = pattern.exists()
-            count = len(list(pattern.glob('*'))) if exists else 0
-        else:
-            files = list(pattern.parent.glob(pattern.name))
-            exists = len(files) > 0
-            count = len(files)
+    # Classify today's files with one directory pass per data folder
+    counts = {'News Data': 0, 'Poll Data': 0, 'Features': 0}
+    for root in (Config.RAW_DATA_DIR, Config.PROCESSED_DATA_DIR):
+        if not root.exists():
+            continue
         
+        with os.scandir(root) as entries:
+            for entry in entries:
+                file_name = entry.name
+                if today not in file_name:
+                    continue
+                
+                if root == Config.RAW_DATA_DIR:
+                    counts['News Data'] += 'news' in file_name
+                else:
+                    counts['Poll Data'] += 'poll' in file_name
+                    counts['Features'] += file_name.startswith('features')
+    
+    data_checks = [(name, count > 0, count) for name, count in counts.items()]
+    
+    today_results = Config.RESULTS_DIR / today
+    results_exist = today_results.exists()
+    data_checks.append(('Results', results_exist, _count_entries(today_results)))
+    
+    for name, exists, count in data_checks:
         status['data_files'][name] = {'exists': exists, 'count': count}
         
         status_icon = "✅" if exists else "⚠️"
@@ -439,9 +474,9 @@ def cmd_status():
     env_file = Path(".env")
     config_items = [
         ('Environment File', env_file.exists()),
-        ('News API Key', bool(Config.NEWS_API_KEY)),
-        ('Twitter Token', bool(Config.TWITTER_BEARER_TOKEN)),
-        ('HuggingFace Token', bool(Config.HUGGINGFACE_TOKEN))
+        ('News API Key', Config.has_news_api()),
+        ('Twitter Token', Config.has_twitter_token()),
+        ('HuggingFace Token', Config.has_huggingface_token())
     ]
     
     for name, exists in config_items:
@@ -453,14 +488,14 @@ def cmd_status():
     print(f"\n📈 Latest Results:")
     
     try:
-        result_dirs = sorted([d for d in Config.RESULTS_DIR.iterdir() if d.is_dir()], reverse=True)
-        if result_dirs:
-            latest_dir = result_dirs[0]
+        # Single pass for the newest (date-named) results directory
+        with os.scandir(Config.RESULTS_DIR) as entries:
+            latest_dir = max((Path(e.path) for e in entries if e.is_dir()), key=lambda p: p.name, default=None)
+        if latest_dir is not None:
             summary_file = latest_dir / "forecast_summary.json"
             
             if summary_file.exists():
-                with open(summary_file) as f:
-                    summary = json.load(f)
+                summary = read_json(summary_file)
                 
                 if 'nda_projection' in summary:
                     nda_proj = summary['nda_projection']
@@ -486,25 +521,13 @@ def cmd_status():
     # Overall health assessment
     print(f"\n" + "=" * 60)
     
-    # Calculate health score
-    health_score = 0
-    total_checks = 0
-    
-    # Directory health (25%)
-    dir_health = sum(1 for d in status['directories'].values() if d['exists']) / len(status['directories'])
-    health_score += dir_health * 0.25
-    
-    # Data health (25%)
-    data_health = sum(1 for d in status['data_files'].values() if d['exists']) / len(status['data_files'])
-    health_score += data_health * 0.25
-    
-    # Config health (25%)
-    config_health = sum(1 for c in status['configuration'].values() if c) / len(status['configuration'])
-    health_score += config_health * 0.25
-    
-    # Results health (25%)
+    # Calculate health score: equal-weighted mean of directory, data, config and results health
+    dir_health = np.mean([d['exists'] for d in status['directories'].values()])
+    data_health = np.mean([d['exists'] for d in status['data_files'].values()])
+    config_health = np.mean(list(status['configuration'].values()))
     results_health = 1.0 if status['recent_results'] else 0.0
-    health_score += results_health * 0.25
+    
+    health_score = float(np.mean([dir_health, data_health, config_health, results_health]))
     
     if health_score >= 0.8:
         health_status = "🟢 EXCELLENT"
@@ -551,9 +574,11 @@ For more information, visit: https://github.com/yourusername/bihar-forecast
     
     # Init command
     init_parser = subparsers.add_parser('init', help='Initialize system (first time setup)')
+    init_parser.set_defaults(func=cmd_init)
     
     # Update command
     update_parser = subparsers.add_parser('update', help='Run daily update once')
+    update_parser.set_defaults(func=cmd_update)
     
     # Schedule command
     schedule_parser = subparsers.add_parser('schedule', help='Start automated scheduler')
@@ -561,35 +586,27 @@ For more information, visit: https://github.com/yourusername/bihar-forecast
                                help='Hour for daily update (0-23)')
     schedule_parser.add_argument('--quick-interval', type=int, default=4,
                                help='Hours between quick updates')
+    schedule_parser.set_defaults(func=cmd_schedule)
     
     # Dashboard command
     dashboard_parser = subparsers.add_parser('dashboard', help='Launch web dashboard')
     dashboard_parser.add_argument('--port', type=int, default=8501,
                                 help='Port for dashboard server')
+    dashboard_parser.set_defaults(func=cmd_dashboard)
     
     # Test command
     test_parser = subparsers.add_parser('test', help='Run system tests')
+    test_parser.set_defaults(func=cmd_test)
     
     # Status command
     status_parser = subparsers.add_parser('status', help='Show system status')
+    status_parser.set_defaults(func=cmd_status)
     
     args = parser.parse_args()
     
-    # Execute commands
-    success = False
-    
-    if args.command == 'init':
-        success = cmd_init()
-    elif args.command == 'update':
-        success = cmd_update()
-    elif args.command == 'schedule':
-        success = cmd_schedule()
-    elif args.command == 'dashboard':
-        success = cmd_dashboard()
-    elif args.command == 'test':
-        success = cmd_test()
-    elif args.command == 'status':
-        success = cmd_status()
+    # Execute command
+    if getattr(args, 'func', None):
+        success = args.func()
     else:
         parser.print_help()
         success = True
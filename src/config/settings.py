@@ -1,5 +1,9 @@
 import os
+import re
+import sys
+import numpy as np
 from pathlib import Path
+from typing import Callable, Iterable, List
 
 # Try to load dotenv if available, otherwise continue without it
 try:
@@ -8,6 +12,34 @@ try:
 except ImportError:
     print("Warning: python-dotenv not installed. Using environment variables directly.")
 
+# Try to import pyahocorasick for multi-keyword scanning, fall back to a regex alternation
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def build_keyword_matcher(keywords: Iterable[str]) -> Callable[[str], List[str]]:
+    """Compile keywords into one case-insensitive matcher returning the keywords found in a text"""
+    lookup = {keyword.lower(): keyword for keyword in keywords}
+    
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for key, keyword in lookup.items():
+            automaton.add_word(key, keyword)
+        automaton.make_automaton()
+        
+        def match(text: str) -> List[str]:
+            return list(dict.fromkeys(keyword for _, keyword in automaton.iter(text.lower())))
+    else:
+        pattern = re.compile('|'.join(map(re.escape, sorted(lookup, key=len, reverse=True))))
+        
+        def match(text: str) -> List[str]:
+            return list(dict.fromkeys(lookup[m.group(0)] for m in pattern.finditer(text.lower())))
+    
+    return match
+
 class Config:
     """Central configuration for the forecast system"""
     
@@ -19,10 +51,10 @@ class Config:
     MODELS_DIR = DATA_DIR / "models"
     RESULTS_DIR = DATA_DIR / "results"
     
-    # API Keys
-    NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
-    TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN", "")
-    HUGGINGFACE_TOKEN = os.getenv("HUGGINGFACE_TOKEN", "")
+    # API Keys (read once here; use these attributes instead of os.getenv elsewhere)
+    NEWS_API_KEY = sys.intern(os.getenv("NEWS_API_KEY", ""))
+    TWITTER_BEARER_TOKEN = sys.intern(os.getenv("TWITTER_BEARER_TOKEN", ""))
+    HUGGINGFACE_TOKEN = sys.intern(os.getenv("HUGGINGFACE_TOKEN", ""))
     
     # Data Sources
     NEWS_SOURCES = [
@@ -32,7 +64,7 @@ class Config:
         "india-today"
     ]
     
-    BIHAR_KEYWORDS = [
+    BIHAR_KEYWORDS = tuple(sys.intern(keyword) for keyword in (
         # Core election terms
         "Bihar election", "Bihar assembly", "Bihar polls", "Bihar voting", "Bihar constituency",
         
@@ -54,7 +86,7 @@ class Config:
         # Election-specific terms
         "Bihar candidate", "Bihar nomination", "Bihar campaign", "Bihar rally",
         "Bihar seat sharing", "Bihar alliance", "Bihar manifesto", "Bihar debate"
-    ]
+    ))
     
     # Model parameters
     N_MONTE_CARLO_SIMS = 5000
@@ -71,8 +103,33 @@ class Config:
     # Constituency mapping
     CONSTITUENCY_COUNT = 243
     
+    # Shared read-only constituency-shaped array (.copy() before mutating)
+    CONSTITUENCY_ZEROS = np.zeros(CONSTITUENCY_COUNT, dtype=np.float32)
+    CONSTITUENCY_ZEROS.setflags(write=False)
+    
+    _directories_created = False
+    
+    @classmethod
+    def has_news_api(cls) -> bool:
+        """Whether a NewsAPI key is configured"""
+        return bool(cls.NEWS_API_KEY)
+    
+    @classmethod
+    def has_twitter_token(cls) -> bool:
+        """Whether a Twitter bearer token is configured"""
+        return bool(cls.TWITTER_BEARER_TOKEN)
+    
+    @classmethod
+    def has_huggingface_token(cls) -> bool:
+        """Whether a HuggingFace token is configured"""
+        return bool(cls.HUGGINGFACE_TOKEN)
+    
     @classmethod
     def create_directories(cls):
-        """Create necessary directories if they don't exist"""
+        """Create necessary directories if they don't exist (once per process)"""
+        if cls._directories_created:
+            return
+        
         for dir_path in [cls.RAW_DATA_DIR, cls.PROCESSED_DATA_DIR, cls.MODELS_DIR, cls.RESULTS_DIR]:
-            dir_path.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+            dir_path.mkdir(parents=True, exist_ok=True)
+        cls._directories_created = True
\ No newline at end of file
@@ -1,11 +1,9 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 import numpy as np
+from scipy import stats
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
 import sys
 import os
 
@@ -15,6 +13,9 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # Now import from src
 from src.config.settings import Config
+from src.utils.fast_json import loads, read_json
+from src.dashboard.candidate_cards import CANDIDATE_CARD_HTML, TREND_BADGE_HTML, rank_style
+from src.dashboard.constituency_cache import get_analyzer, get_matchup, constituency_names
 
 # Page configuration
 st.set_page_config(
@@ -24,6 +25,663 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Dashboard-wide styles, re-sent on every run since Streamlit drops elements a rerun does not emit
+CUSTOM_CSS = """
+<style>
+.main-header {
+    font-size: 2.5rem;
+    font-weight: bold;
+    color: #1f77b4;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+
+.metric-container {
+    background-color: #f0f2f6;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    margin: 0.5rem 0;
+}
+
+.metric-row {
+    display: flex;
+    gap: 1rem;
+}
+
+.metric-row .metric-container {
+    flex: 1;
+}
+
+.metric-label {
+    font-size: 0.875rem;
+    color: #31333f;
+}
+
+.metric-value {
+    font-size: 2.25rem;
+}
+
+.metric-delta {
+    font-size: 0.875rem;
+    color: #09ab3b;
+    min-height: 1.25rem;
+}
+
+.status-good {
+    color: #28a745;
+    font-weight: bold;
+}
+
+.status-warning {
+    color: #ffc107;
+    font-weight: bold;
+}
+
+.status-danger {
+    color: #dc3545;
+    font-weight: bold;
+}
+
+.sidebar-info {
+    background-color: #e3f2fd;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    margin: 1rem 0;
+}
+</style>
+"""
+
+# Party projection table: share of the alliance total for NDA/INDI members, fixed seats for others
+PARTY_COLUMNS = ['Party', 'Code', 'Alliance', 'Share', 'Fixed Seats', 'Leader', 'Symbol', 'Color']
+PARTY_RECORDS = [
+    # NDA parties with realistic distribution
+    ('Bharatiya Janata Party', 'BJP', 'NDA', 0.51, 0, 'Sushil Kumar Modi', 'Lotus', '#FF9933'),
+    ('Janata Dal (United)', 'JDU', 'NDA', 0.41, 0, 'Nitish Kumar', 'Arrow', '#138808'),
+    ('Hindustani Awam Morcha', 'HAM', 'NDA', 0.05, 0, 'Jitan Ram Manjhi', 'Pressure Cooker', '#800080'),
+    ('Vikassheel Insaan Party', 'VIP', 'NDA', 0.03, 0, 'Mukesh Sahani', 'Broom', '#FFD700'),
+    
+    # INDI parties with realistic distribution
+    ('Rashtriya Janata Dal', 'RJD', 'INDI', 0.82, 0, 'Tejashwi Yadav', 'Lantern', '#008000'),
+    ('Indian National Congress', 'INC', 'INDI', 0.13, 0, 'Madan Mohan Jha', 'Hand', '#19AAED'),
+    ('Communist Party of India (ML)', 'CPI_ML', 'INDI', 0.05, 0, 'Kunal', 'Sickle', '#FF0000'),
+    
+    # Others with fixed realistic numbers (these don't scale much)
+    ('Jan Suraaj Party', 'JSP', 'Others', 0.0, 12, 'Prashant Kishor', 'Torch', '#FF6B35'),
+    ('All India Majlis-e-Ittehadul Muslimeen', 'AIMIM', 'Others', 0.0, 4, 'Akhtarul Iman', 'Kite', '#00FF00'),
+    ('Lok Janshakti Party (Secular)', 'LJSP', 'Others', 0.0, 3, 'Chirag Paswan', 'Helicopter', '#4169E1'),
+    ('Bahujan Samaj Party', 'BSP', 'Others', 0.0, 2, 'Bharat Singh', 'Elephant', '#0000FF'),
+    ('Others/Independents', 'OTH', 'Others', 0.0, 8, 'Various', 'Various', '#808080')
+]
+
+# Constituency detail cards, filled with str.format_map from the per-rank style dicts below
+INFO_CARD_HTML = (
+    '<div style="background: {bg_color}; border: 2px solid {border_color}; border-radius: 8px; padding: 1rem; text-align: center;">'
+    '<h3 style="color: {title_color}; margin: 0;">{value}</h3>'
+    '<p style="color: {label_color}; margin: 0;">{label}</p>'
+    '</div>'
+)
+INFO_CARD_STYLES = (
+    {'label': 'Constituency Code', 'bg_color': '#E8F5E8', 'border_color': '#4CAF50', 'title_color': '#2E7D32', 'label_color': '#388E3C'},
+    {'label': 'Region', 'bg_color': '#FFF3E0', 'border_color': '#FF9800', 'title_color': '#E65100', 'label_color': '#F57C00'},
+    {'label': 'Total Candidates', 'bg_color': '#E3F2FD', 'border_color': '#2196F3', 'title_color': '#1565C0', 'label_color': '#1976D2'},
+    {'label': 'Battle Type', 'bg_color': '#FCE4EC', 'border_color': '#E91E63', 'title_color': '#AD1457', 'label_color': '#C2185B'},
+)
+PREVIOUS_RESULT_CARD_STYLES = tuple(
+    {'label': label, 'bg_color': '#E8F5E8', 'border_color': '#4CAF50', 'title_color': '#2E7D32', 'label_color': '#388E3C'}
+    for label in ('2020 Winner', 'Winning Party', 'Victory Margin')
+)
+METRIC_CARDS_HTML = '<div style="display: grid; grid-template-columns: repeat({n_cards}, 1fr); gap: 1rem; margin: 0.5rem 0;">{cards}</div>'
+
+SWOT_PANEL_HTML = """<div style="background: {bg_color}; border: 2px solid {card_color}; border-radius: 8px; padding: 1rem; margin: 0.5rem 0;">
+<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
+<div><h3>✅ STRENGTHS</h3><ul>{strengths}</ul></div>
+<div><h3>⚠️ CHALLENGES</h3><ul>{challenges}</ul></div>
+</div>
+</div>"""
+
+# Seat classification by NDA win probability: upper bin edges (right-closed) and their labels
+CLASSIFICATION_EDGES = [0.2, 0.4, 0.6, 0.8]
+CLASSIFICATION_LABELS = np.array(['Safe INDI', 'Likely INDI', 'Toss-up', 'Likely NDA', 'Safe NDA'])
+CLASSIFICATION_COLORS = {
+    'Safe NDA': '#8B0000',
+    'Likely NDA': '#FF4500',
+    'Toss-up': '#FFD700',
+    'Likely INDI': '#4169E1',
+    'Safe INDI': '#000080'
+}
+
+# Candidate data behind the constituency analyzer; its mtime invalidates the disk-cached summary
+CANDIDATE_DATA_FILE = Path(__file__).parent.parent / "data" / "all_constituencies.json"
+
+# Low-cardinality constituency summary columns stored as categoricals for the filters and counts
+SUMMARY_CATEGORY_COLUMNS = ['region', 'winner_party', 'winner_alliance', 'contest_margin']
+
+# Constituency details page blocks; static ones are emitted as-is, templates are filled with str.format_map
+CONSTITUENCY_DETAILS_HEADER_HTML = """
+<div style="background: linear-gradient(90deg, #FF6B35 0%, #F7931E 100%); 
+            padding: 1.5rem; border-radius: 10px; margin-bottom: 2rem;">
+    <h1 style="color: white; text-align: center; margin: 0; font-size: 2.5rem;">
+        🏛️ CONSTITUENCY DETAILS - DEEP DIVE ANALYSIS
+    </h1>
+    <p style="color: white; text-align: center; margin: 0.5rem 0 0 0; font-size: 1.2rem;">
+        Complete candidate-wise analysis for all 243 Bihar constituencies
+    </p>
+</div>
+<div style="background: #E3F2FD; border-left: 5px solid #2196F3; padding: 1rem; margin-bottom: 2rem;">
+    <h3 style="color: #1976D2; margin: 0;">🎯 What You'll Find Here:</h3>
+    <ul style="margin: 0.5rem 0 0 0; color: #1976D2;">
+        <li><strong>Detailed Candidate Matchups:</strong> Head-to-head analysis with winning chances</li>
+        <li><strong>Historical Context:</strong> Previous election results and trends</li>
+        <li><strong>Demographics:</strong> Voter composition and regional factors</li>
+        <li><strong>Complete Coverage:</strong> All 243 constituencies with filtering options</li>
+    </ul>
+</div>
+"""
+
+CONSTITUENCY_DATA_MISSING_HTML = """
+<div style="background: #E3F2FD; border: 2px solid #2196F3; border-radius: 10px; padding: 1.5rem; margin: 1rem 0;">
+    <h3 style="color: #1565C0; margin: 0 0 1rem 0;">📊 Constituency Data Not Available</h3>
+    <p style="color: #0D47A1; margin: 0;">
+        Run the data pipeline to generate constituency-level forecasts and detailed candidate analysis.
+    </p>
+    <p style="color: #1976D2; margin: 0.5rem 0 0 0; font-weight: bold;">
+        Command: <code>python main.py update</code>
+    </p>
+</div>
+"""
+
+CONSTITUENCY_SECTION_HTML = {
+    'matchups': """
+    <div style="background: #FFF3E0; border: 2px solid #FF9800; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
+        <h2 style="color: #E65100; margin: 0;">🏛️ DETAILED CANDIDATE MATCHUPS</h2>
+        <p style="color: #BF360C; margin: 0.5rem 0 0 0;">Select any constituency for complete candidate analysis</p>
+    </div>
+    """,
+    'candidates': """
+    <div style="background: #F3E5F5; border: 2px solid #9C27B0; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
+        <h2 style="color: #6A1B9A; margin: 0;">👥 CANDIDATE vs CANDIDATE ANALYSIS</h2>
+        <p style="color: #7B1FA2; margin: 0.5rem 0 0 0;">Complete head-to-head comparison with winning chances</p>
+    </div>
+    """,
+    'comparison': """
+    <div style="background: #ECEFF1; border: 2px solid #607D8B; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
+        <h3 style="color: #37474F; margin: 0;">📊 QUICK COMPARISON TABLE</h3>
+    </div>
+    """,
+    'strengths': """
+    <div style="background: #E1F5FE; border: 2px solid #0288D1; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
+        <h2 style="color: #01579B; margin: 0;">💪 CANDIDATE STRENGTHS & CHALLENGES</h2>
+        <p style="color: #0277BD; margin: 0.5rem 0 0 0;">Detailed SWOT analysis for top candidates</p>
+    </div>
+    """,
+    'history': """
+    <div style="background: #FFF8E1; border: 2px solid #FFC107; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
+        <h2 style="color: #F57F17; margin: 0;">📊 HISTORICAL CONTEXT & DEMOGRAPHICS</h2>
+        <p style="color: #FF8F00; margin: 0.5rem 0 0 0;">Past election results and voter composition analysis</p>
+    </div>
+    """,
+    'previous_results': """
+    <div style="background: #E8F5E8; border: 2px solid #4CAF50; border-radius: 8px; padding: 1.5rem;">
+        <h3 style="color: #2E7D32; margin: 0 0 1rem 0;">🏆 PREVIOUS ELECTION RESULTS</h3>
+    </div>
+    """,
+    'demographics': """
+    <div style="background: #E3F2FD; border: 2px solid #2196F3; border-radius: 8px; padding: 1.5rem;">
+        <h3 style="color: #1565C0; margin: 0 0 1rem 0;">👥 VOTER DEMOGRAPHICS</h3>
+    </div>
+    """,
+}
+
+CONSTITUENCY_BANNER_HTML = """
+<div style="background: linear-gradient(135deg, #4CAF50 0%, #45A049 100%); 
+            color: white; padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
+    <h2 style="margin: 0; text-align: center;">🏛️ {name}</h2>
+    <p style="margin: 0.5rem 0 0 0; text-align: center; font-size: 1.1rem;">
+        {region} Region • {battle_type} • {key_contest}
+    </p>
+</div>
+"""
+
+CONSTITUENCY_SUMMARY_HEADER_HTML = """
+<div style="height: 3px; background: linear-gradient(90deg, #FF6B35 0%, #F7931E 50%, #FF6B35 100%); 
+            margin: 3rem 0; border-radius: 2px;"></div>
+<div style="background: linear-gradient(135deg, #673AB7 0%, #9C27B0 100%); 
+            color: white; padding: 1.5rem; border-radius: 10px; margin: 2rem 0;">
+    <h1 style="margin: 0; text-align: center;">📋 ALL CONSTITUENCIES SUMMARY</h1>
+    <p style="margin: 0.5rem 0 0 0; text-align: center; font-size: 1.1rem;">
+        Complete overview of all 243 Bihar constituencies with advanced filtering
+    </p>
+</div>
+"""
+
+# Names of the values returned by load_latest_results, in order
+RESULT_FIELDS = ('summary', 'marginal_df', 'const_prob_df', 'sim_summary', 'latest_dir')
+
+# Consolidated forecast history kept alongside the date directories in RESULTS_DIR
+HISTORY_FILE = "historical.parquet"
+HISTORY_COLUMNS = ['date', 'mean_seats', 'prob_majority']
+
+# Files the pipeline writes into each date directory
+RESULT_FILES = ('forecast_summary.json', 'marginal_seats.csv', 'constituency_probabilities.csv', 'simulation_summary.json')
+
+def _latest_mtime(results_dir: str) -> float:
+    """Newest mtime of the date directories and the latest one's result files, passed to the cached loaders so a new or rerun forecast invalidates them"""
+    try:
+        date_dirs = [d for d in Path(results_dir).iterdir() if d.is_dir()]
+        mtimes = [d.stat().st_mtime for d in date_dirs]
+    except OSError:
+        return 0.0
+    if not date_dirs:
+        return 0.0
+    
+    # Files overwritten in place do not change their directory's mtime
+    latest_dir = max(date_dirs, key=lambda d: d.name)
+    for name in RESULT_FILES:
+        try:
+            mtimes.append((latest_dir / name).stat().st_mtime)
+        except FileNotFoundError:
+            continue
+    return max(mtimes)
+
+
+@st.cache_data(show_spinner=False)
+def _read_json_cached(path: str, mtime: float):
+    """Parse a JSON file; mtime is part of the cache key so a rewritten file is read again"""
+    return read_json(path)
+
+
+def _load_json(path: Path) -> dict:
+    """Cached JSON read keyed on the file's mtime, {} if it does not exist"""
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    return _read_json_cached(str(path), mtime)
+
+
+@st.cache_data(show_spinner=False)
+def _read_bytes_cached(path: str, mtime: float) -> bytes:
+    """Raw file contents; mtime is part of the cache key so a rewritten file is read again"""
+    return Path(path).read_bytes()
+
+
+def _load_bytes(path: Path):
+    """Cached raw file read keyed on the file's mtime, None if it does not exist"""
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    return _read_bytes_cached(str(path), mtime)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _list_date_dirs(results_dir: str, mtime: float) -> list:
+    """Date directory names under results_dir, newest first"""
+    return sorted((d.name for d in Path(results_dir).iterdir() if d.is_dir()), reverse=True)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_latest_results(results_dir: str, mtime: float):
+    """Load most recent forecast results"""
+    try:
+        # Get most recent date directory
+        date_dirs = _list_date_dirs(results_dir, mtime)
+        
+        if not date_dirs:
+            return {}, pd.DataFrame(), pd.DataFrame(), {}, None
+        
+        latest_dir = Path(results_dir) / date_dirs[0]
+        
+        # Load forecast summary
+        summary = _load_json(latest_dir / "forecast_summary.json")
+        
+        # Load marginal seats
+        marginal_path = latest_dir / "marginal_seats.csv"
+        marginal_df = pd.DataFrame()
+        if marginal_path.exists():
+            marginal_df = pd.read_csv(
+                marginal_path,
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                usecols=['constituency', 'region', 'nda_win_prob', 'classification'],
+                dtype={'constituency': 'category', 'region': 'category',
+                       'classification': 'category', 'nda_win_prob': 'float32'}
+            )
+        
+        # Load constituency probabilities
+        const_prob_path = latest_dir / "constituency_probabilities.csv"
+        const_prob_df = pd.DataFrame()
+        if const_prob_path.exists():
+            const_prob_df = pd.read_csv(
+                const_prob_path,
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                usecols=['constituency', 'region', 'nda_win_probability'],
+                dtype={'constituency': 'category', 'region': 'category'}
+            )
+        
+        # Load simulation summary
+        sim_summary = _load_json(latest_dir / "simulation_summary.json")
+        
+        return summary, marginal_df, const_prob_df, sim_summary, latest_dir
+        
+    except Exception as e:
+        st.error(f"Error loading results: {e}")
+        return {}, pd.DataFrame(), pd.DataFrame(), {}, None
+
+
+def _read_history(results_dir: Path, date_dirs: list) -> pd.DataFrame:
+    """Forecast history from historical.parquet, written by the daily pipeline, or from the date directories if it is missing"""
+    history_path = results_dir / HISTORY_FILE
+    if history_path.exists():
+        return pd.read_parquet(history_path, columns=HISTORY_COLUMNS)
+    
+    summaries = []
+    for name in date_dirs:
+        summary = _load_json(results_dir / name / "forecast_summary.json")
+        if summary:
+            summaries.append({**summary, 'date': name})
+    
+    if not summaries:
+        return pd.DataFrame(columns=HISTORY_COLUMNS).astype({'mean_seats': float, 'prob_majority': float})
+    
+    # Flatten nda_projection into native float columns in one pass
+    return pd.json_normalize(summaries).rename(columns={
+        'nda_projection.mean_seats': 'mean_seats',
+        'nda_projection.probability_majority': 'prob_majority'
+    }).reindex(columns=HISTORY_COLUMNS).fillna(0)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_historical_forecasts(results_dir: str, mtime: float, days=30):
+    """Load historical forecast data"""
+    try:
+        history = _read_history(Path(results_dir), _list_date_dirs(results_dir, mtime))
+        return history.sort_values('date', ascending=False).head(days).reset_index(drop=True)
+        
+    except Exception as e:
+        st.error(f"Error loading historical data: {e}")
+        return pd.DataFrame()
+
+@st.cache_data(show_spinner=False)
+def _party_table() -> pd.DataFrame:
+    """Static party metadata and seat shares for the party analysis tab"""
+    return pd.DataFrame.from_records(PARTY_RECORDS, columns=PARTY_COLUMNS).astype({
+        'Share': 'float64', 'Fixed Seats': 'int64'
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _build_party_projections(mean_nda: float, mean_indi: float):
+    """Party seat projections and the party-wise chart (as Plotly JSON) for the given alliance totals"""
+    import plotly.graph_objects as go
+    
+    # Alliance members scale with the forecast totals, others are fixed
+    party_df = _party_table()
+    alliance_total = party_df['Alliance'].map({'NDA': mean_nda, 'INDI': mean_indi}).fillna(0)
+    party_df['Expected Seats'] = (party_df['Share'] * alliance_total + party_df['Fixed Seats']).astype(int)
+    
+    fig_party = go.Figure(data=[
+        go.Bar(
+            x=party_df['Party'],
+            y=party_df['Expected Seats'],
+            marker_color=party_df['Color'],
+            text=party_df['Expected Seats'],
+            textposition='auto',
+            hovertemplate='<b>%{x}</b><br>Expected Seats: %{y}<br>Leader: %{customdata}<extra></extra>',
+            customdata=party_df['Leader']
+        )
+    ])
+    
+    fig_party.update_layout(
+        title="Party-wise Seat Projections",
+        xaxis_title="Political Parties",
+        yaxis_title="Expected Seats",
+        height=500,
+        xaxis_tickangle=-45
+    )
+    
+    return party_df, fig_party.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _build_seat_class_figs(values: tuple, categories: tuple, colors: tuple):
+    """Build the seat classification bar and pie charts as Plotly JSON"""
+    import plotly.graph_objects as go
+    
+    # Bar chart
+    fig_bar = go.Figure(data=[
+        go.Bar(x=categories, y=values, marker_color=colors, text=values, textposition='auto')
+    ])
+    
+    fig_bar.update_layout(
+        title="Seat Classification",
+        xaxis_title="Category",
+        yaxis_title="Number of Seats",
+        height=400
+    )
+    
+    # Pie chart
+    fig_pie = go.Figure(data=[
+        go.Pie(labels=categories, values=values, marker_colors=colors, hole=0.3)
+    ])
+    
+    fig_pie.update_layout(
+        title="Seat Distribution",
+        height=400
+    )
+    
+    return fig_bar.to_json(), fig_pie.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _build_seat_distribution_fig(mean_seats: float, std_seats: float) -> str:
+    """Build the normal-approximation NDA seat density as Plotly JSON"""
+    import plotly.graph_objects as go
+    
+    x = np.linspace(max(0, mean_seats - 4*std_seats), min(243, mean_seats + 4*std_seats), 100)
+    y = stats.norm.pdf(x, loc=mean_seats, scale=std_seats)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x, y=y, mode='lines', fill='tonexty', name='Probability Density'))
+    fig.add_vline(x=122, line_dash="dash", line_color="red", annotation_text="Majority (122)")
+    fig.add_vline(x=mean_seats, line_dash="dot", line_color="blue", annotation_text=f"Mean ({mean_seats:.0f})")
+    
+    fig.update_layout(
+        title="NDA Seat Probability Distribution",
+        xaxis_title="NDA Seats",
+        yaxis_title="Probability Density",
+        height=400
+    )
+    
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _build_marginal_fig(rows: tuple):
+    """Build the competitive seats bar chart from (constituency, nda_win_prob) pairs as Plotly JSON"""
+    import plotly.graph_objects as go
+    
+    constituencies = [c for c, _ in rows]
+    probs = np.array([p for _, p in rows])
+    
+    fig = go.Figure()
+    
+    colors = np.where(probs < 0.5, '#FF6B6B', '#4ECDC4').tolist()
+    
+    fig.add_trace(go.Bar(
+        y=constituencies,
+        x=probs,
+        orientation='h',
+        marker_color=colors,
+        text=[f"{p:.1%}" for p in probs],
+        textposition='auto'
+    ))
+    
+    fig.add_vline(x=0.5, line_dash="dash", line_color="black", annotation_text="50%")
+    
+    fig.update_layout(
+        title="Top 20 Most Competitive Seats",
+        xaxis_title="NDA Win Probability",
+        yaxis_title="Constituency",
+        height=600
+    )
+    
+    return fig.to_json()
+
+
+def _plotly_json_chart(fig_json: str, height: int):
+    """Render a figure cached as Plotly JSON with st.plotly_chart, using height unless the layout sets one"""
+    fig = loads(fig_json)
+    fig.setdefault('layout', {}).setdefault('height', height)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _regional_agg(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-region seat totals and expected NDA/INDI seats from region and nda_win_probability columns"""
+    grouped = df.groupby('region', observed=True)['nda_win_probability']
+    avg = grouped.mean()
+    total = grouped.size().to_numpy()
+    expected_nda = np.round(avg.to_numpy() * total, 1)
+    
+    display_regional = pd.DataFrame({
+        'Total Seats': total,
+        'Expected NDA': expected_nda,
+        'Expected INDI': np.round(total - expected_nda, 1),
+        'NDA Win %': np.round(avg.to_numpy() * 100, 1)
+    }, index=avg.index)
+    return display_regional
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_regional_fig(df: pd.DataFrame) -> str:
+    """Build the expected-seats-by-region stacked bar chart from a dict spec as Plotly JSON"""
+    import plotly.graph_objects as go
+    
+    regional = _regional_agg(df)
+    regions = regional.index.astype(str).tolist()
+    
+    fig = go.Figure({
+        'data': [
+            {'type': 'bar', 'name': 'NDA Expected', 'x': regions,
+             'y': regional['Expected NDA'].tolist(), 'marker': {'color': '#FF9933'}},
+            {'type': 'bar', 'name': 'INDI Expected', 'x': regions,
+             'y': regional['Expected INDI'].tolist(), 'marker': {'color': '#138808'}}
+        ],
+        'layout': {
+            'title': {'text': "Expected Seats by Region"},
+            'xaxis': {'title': {'text': "Region"}},
+            'yaxis': {'title': {'text': "Expected Seats"}},
+            'barmode': 'stack',
+            'height': 400
+        }
+    })
+    
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _build_constituency_map_fig(df: pd.DataFrame) -> str:
+    """Build the constituency win-probability scatter as Plotly JSON, coloured by classification when present"""
+    import plotly.graph_objects as go
+    
+    if 'classification' in df.columns:
+        # One WebGL trace per class so the legend keys the colours; each class is indexed from 0 along x
+        fig = go.Figure()
+        for label, class_df in df.groupby('classification', observed=True, sort=False):
+            fig.add_trace(go.Scattergl(
+                x=np.arange(len(class_df), dtype=np.int32),
+                y=class_df['nda_win_probability'].to_numpy(dtype=np.float64),
+                mode='markers',
+                name=str(label),
+                marker=dict(
+                    color=CLASSIFICATION_COLORS.get(str(label), '#808080'),
+                    size=10,
+                    opacity=0.7
+                ),
+                text=class_df['constituency'].to_numpy(),
+                hovertemplate='<b>%{text}</b><br>NDA Prob: %{y:.1%}<extra></extra>'
+            ))
+    else:
+        # Simple WebGL scatter without classification
+        fig = go.Figure(go.Scattergl(
+            x=np.arange(len(df), dtype=np.int32),
+            y=df['nda_win_probability'].to_numpy(dtype=np.float64),
+            mode='markers',
+            name='Constituencies',
+            marker=dict(
+                color='#4169E1',
+                size=10,
+                opacity=0.7
+            ),
+            text=df['constituency'].to_numpy(),
+            hovertemplate='<b>%{text}</b><br>NDA Prob: %{y:.1%}<extra></extra>'
+        ))
+    
+    fig.add_hline(y=0.5, line_dash="dash", line_color="black", annotation_text="50% (Even)")
+    
+    fig.update_layout(
+        title="Constituency Win Probabilities",
+        xaxis_title="Constituency Index",
+        yaxis_title="NDA Win Probability",
+        height=500,
+        showlegend=True
+    )
+    
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _add_classification(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df with a classification column binned from nda_win_probability"""
+    idx = np.digitize(df['nda_win_probability'].to_numpy(), CLASSIFICATION_EDGES, right=True)
+    out = df.copy()
+    out['classification'] = pd.Categorical.from_codes(idx, categories=CLASSIFICATION_LABELS, ordered=True)
+    return out
+
+
+@st.cache_data(show_spinner=False)
+def _filter_options(values: pd.Series) -> list:
+    """'All' followed by the sorted distinct values of a column, for filter selectboxes"""
+    return ['All'] + sorted(values.dropna().unique().tolist())
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _all_constituencies_summary(mtime: float) -> pd.DataFrame:
+    """Summary row per constituency, persisted to disk; mtime of the candidate data keys the cache"""
+    summary_df = get_analyzer().get_all_constituencies_summary()
+    if summary_df is None or summary_df.empty:
+        return summary_df
+    return summary_df.astype({column: 'category' for column in SUMMARY_CATEGORY_COLUMNS})
+
+
+
+def _load_constituency_summary() -> pd.DataFrame:
+    """Disk-cached constituency summary, rebuilt only when the candidate data file changes"""
+    try:
+        mtime = CANDIDATE_DATA_FILE.stat().st_mtime
+    except FileNotFoundError:
+        mtime = 0.0
+    return _all_constituencies_summary(mtime)
+
+
+@st.cache_data(show_spinner=False)
+def _constituency_display_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Filtered forecast rows sorted by NDA win probability, with the probability formatted as a percentage"""
+    display_df = df.sort_values('nda_win_probability', ascending=False)
+    probs = display_df['nda_win_probability'].to_numpy(dtype=float)
+    display_df['nda_win_probability'] = np.char.add(np.round(probs * 100, 1).astype(str), '%')
+    display_df.columns = ['Constituency', 'Region', 'NDA Win Prob', 'Classification'][:len(df.columns)]
+    return display_df
+
+
+def _metric_cards(styles: tuple, values: tuple) -> str:
+    """One row of info cards as a single HTML string, pairing each style dict with its value"""
+    cards = "".join(INFO_CARD_HTML.format_map({**style, 'value': value}) for style, value in zip(styles, values))
+    return METRIC_CARDS_HTML.format(n_cards=len(styles), cards=cards)
+
+
 class ForecastDashboard:
     """Interactive Streamlit dashboard for Bihar election forecasts"""
     
@@ -40,110 +698,20 @@ class ForecastDashboard:
     
     def _inject_custom_css(self):
         """Inject custom CSS for better styling"""
-        st.markdown("""
-        <style>
-        .main-header {
-            font-size: 2.5rem;
-            font-weight: bold;
-            color: #1f77b4;
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-        
-        .metric-container {
-            background-color: #f0f2f6;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            margin: 0.5rem 0;
-        }
-        
-        .status-good {
-            color: #28a745;
-            font-weight: bold;
-        }
-        
-        .status-warning {
-            color: #ffc107;
-            font-weight: bold;
-        }
-        
-        .status-danger {
-            color: #dc3545;
-            font-weight: bold;
-        }
-        
-        .sidebar-info {
-            background-color: #e3f2fd;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            margin: 1rem 0;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     
     def load_latest_results(self):
         """Load most recent forecast results"""
-        try:
-            # Get most recent date directory
-            date_dirs = sorted([d for d in self.results_dir.iterdir() if d.is_dir()], reverse=True)
-            
-            if not date_dirs:
-                return {}, pd.DataFrame(), pd.DataFrame(), {}, None
-            
-            latest_dir = date_dirs[0]
-            
-            # Load forecast summary
-            summary_path = latest_dir / "forecast_summary.json"
-            summary = {}
-            if summary_path.exists():
-                with open(summary_path) as f:
-                    summary = json.load(f)
-            
-            # Load marginal seats
-            marginal_path = latest_dir / "marginal_seats.csv"
-            marginal_df = pd.DataFrame()
-            if marginal_path.exists():
-                marginal_df = pd.read_csv(marginal_path)
-            
-            # Load constituency probabilities
-            const_prob_path = latest_dir / "constituency_probabilities.csv"
-            const_prob_df = pd.DataFrame()
-            if const_prob_path.exists():
-                const_prob_df = pd.read_csv(const_prob_path)
-            
-            # Load simulation summary
-            sim_summary_path = latest_dir / "simulation_summary.json"
-            sim_summary = {}
-            if sim_summary_path.exists():
-                with open(sim_summary_path) as f:
-                    sim_summary = json.load(f)
-            
-            return summary, marginal_df, const_prob_df, sim_summary, latest_dir
-            
-        except Exception as e:
-            st.error(f"Error loading results: {e}")
-            return {}, pd.DataFrame(), pd.DataFrame(), {}, None
+        results_dir = str(self.results_dir)
+        return _load_latest_results(results_dir, _latest_mtime(results_dir))
     
     def load_historical_forecasts(self, days=30):
         """Load historical forecast data"""
-        historical = []
-        
-        try:
-            date_dirs = sorted([d for d in self.results_dir.iterdir() if d.is_dir()], reverse=True)
-            
-            for date_dir in date_dirs[:days]:
-                summary_path = date_dir / "forecast_summary.json"
-                if summary_path.exists():
-                    with open(summary_path) as f:
-                        summary = json.load(f)
-                    summary['date'] = date_dir.name
-                    historical.append(summary)
-            
-            return pd.DataFrame(historical) if historical else pd.DataFrame()
-            
-        except Exception as e:
-            st.error(f"Error loading historical data: {e}")
-            return pd.DataFrame()
+        results_dir = str(self.results_dir)
+        # The pipeline rewrites the history file after the day's results
+        history_path = self.results_dir / HISTORY_FILE
+        history_mtime = history_path.stat().st_mtime if history_path.exists() else 0.0
+        return _load_historical_forecasts(results_dir, max(_latest_mtime(results_dir), history_mtime), days)
     
     def render_header(self):
         """Render dashboard header"""
@@ -159,13 +727,13 @@ class ForecastDashboard:
         with col2:
             if st.button("🔄 Refresh Data"):
                 st.session_state.last_refresh = datetime.now()
-                st.experimental_rerun()
+                st.cache_data.clear()
+                st.rerun()
         
         with col3:
             auto_refresh = st.checkbox("Auto-refresh (30s)", value=False)
-            if auto_refresh:
-                st.empty()
-                # Note: In production, implement proper auto-refresh
+        
+        return auto_refresh
     
     def render_sidebar(self, summary, latest_dir):
         """Render sidebar with key information"""
@@ -282,37 +850,21 @@ class ForecastDashboard:
         nda_proj = summary['nda_projection']
         seat_class = summary.get('seat_classification', {})
         
-        # Main metrics row
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "Mean NDA Seats",
-                f"{nda_proj['mean_seats']:.0f}",
-                delta=f"±{(nda_proj['mean_seats'] - nda_proj['median_seats']):.0f}"
-            )
-        
-        with col2:
-            st.metric(
-                "Majority Probability",
-                f"{nda_proj['probability_majority']:.1%}",
-                delta=None
-            )
-        
-        with col3:
-            st.metric(
-                "Supermajority Prob",
-                f"{nda_proj['probability_supermajority']:.1%}",
-                delta=None
-            )
+        # Main metrics row, sent as one HTML block
+        competitive_seats = seat_class.get('toss_up', 0)
+        metrics = [
+            ("Mean NDA Seats", f"{nda_proj['mean_seats']:.0f}", f"±{(nda_proj['mean_seats'] - nda_proj['median_seats']):.0f}"),
+            ("Majority Probability", f"{nda_proj['probability_majority']:.1%}", ""),
+            ("Supermajority Prob", f"{nda_proj['probability_supermajority']:.1%}", ""),
+            ("Competitive Seats", competitive_seats, f"{(competitive_seats/243)*100:.1f}% of total")
+        ]
         
-        with col4:
-            competitive_seats = seat_class.get('toss_up', 0)
-            st.metric(
-                "Competitive Seats",
-                competitive_seats,
-                delta=f"{(competitive_seats/243)*100:.1f}% of total"
-            )
+        cards = "".join(
+            f'<div class="metric-container"><div class="metric-label">{label}</div>'
+            f'<div class="metric-value">{value}</div><div class="metric-delta">{delta}</div></div>'
+            for label, value, delta in metrics
+        )
+        st.markdown(f'<div class="metric-row">{cards}</div>', unsafe_allow_html=True)
     
     def render_seat_distribution(self, summary, sim_summary):
         """Render seat distribution analysis"""
@@ -338,35 +890,15 @@ class ForecastDashboard:
         
         colors = ['#8B0000', '#FF4500', '#FFA500', '#FFD700', '#87CEEB', '#4169E1', '#000080']
         
+        fig_bar, fig_pie = _build_seat_class_figs(tuple(values), tuple(categories), tuple(colors))
+        
         col1, col2 = st.columns(2)
         
         with col1:
-            # Bar chart
-            fig_bar = go.Figure(data=[
-                go.Bar(x=categories, y=values, marker_color=colors, text=values, textposition='auto')
-            ])
-            
-            fig_bar.update_layout(
-                title="Seat Classification",
-                xaxis_title="Category",
-                yaxis_title="Number of Seats",
-                height=400
-            )
-            
-            st.plotly_chart(fig_bar, use_container_width=True)
+            _plotly_json_chart(fig_bar, height=400)
         
         with col2:
-            # Pie chart
-            fig_pie = go.Figure(data=[
-                go.Pie(labels=categories, values=values, marker_colors=colors, hole=0.3)
-            ])
-            
-            fig_pie.update_layout(
-                title="Seat Distribution",
-                height=400
-            )
-            
-            st.plotly_chart(fig_pie, use_container_width=True)
+            _plotly_json_chart(fig_pie, height=400)
         
         # Probability distribution if available
         if sim_summary and 'mean_nda_seats' in sim_summary:
@@ -377,22 +909,7 @@ class ForecastDashboard:
             mean_seats = sim_summary['mean_nda_seats']
             std_seats = sim_summary.get('std_nda_seats', 15)
             
-            x = np.linspace(max(0, mean_seats - 4*std_seats), min(243, mean_seats + 4*std_seats), 100)
-            y = np.exp(-0.5 * ((x - mean_seats) / std_seats) ** 2) / (std_seats * np.sqrt(2 * np.pi))
-            
-            fig_dist = go.Figure()
-            fig_dist.add_trace(go.Scatter(x=x, y=y, mode='lines', fill='tonexty', name='Probability Density'))
-            fig_dist.add_vline(x=122, line_dash="dash", line_color="red", annotation_text="Majority (122)")
-            fig_dist.add_vline(x=mean_seats, line_dash="dot", line_color="blue", annotation_text=f"Mean ({mean_seats:.0f})")
-            
-            fig_dist.update_layout(
-                title="NDA Seat Probability Distribution",
-                xaxis_title="NDA Seats",
-                yaxis_title="Probability Density",
-                height=400
-            )
-            
-            st.plotly_chart(fig_dist, use_container_width=True)
+            _plotly_json_chart(_build_seat_distribution_fig(float(mean_seats), float(std_seats)), height=400)
     
     def render_marginal_seats(self, marginal_df):
         """Render marginal seats analysis"""
@@ -419,29 +936,8 @@ class ForecastDashboard:
         
         with col1:
             # Interactive bar chart
-            fig = go.Figure()
-            
-            colors = ['#FF6B6B' if p < 0.5 else '#4ECDC4' for p in top_marginal['nda_win_prob']]
-            
-            fig.add_trace(go.Bar(
-                y=top_marginal['constituency'],
-                x=top_marginal['nda_win_prob'],
-                orientation='h',
-                marker_color=colors,
-                text=[f"{p:.1%}" for p in top_marginal['nda_win_prob']],
-                textposition='auto'
-            ))
-            
-            fig.add_vline(x=0.5, line_dash="dash", line_color="black", annotation_text="50%")
-            
-            fig.update_layout(
-                title="Top 20 Most Competitive Seats",
-                xaxis_title="NDA Win Probability",
-                yaxis_title="Constituency",
-                height=600
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _build_marginal_fig(tuple(zip(top_marginal['constituency'], top_marginal['nda_win_prob'])))
+            _plotly_json_chart(fig, height=600)
         
         with col2:
             st.subheader("📋 Seat Details")
@@ -451,10 +947,12 @@ class ForecastDashboard:
             display_df['nda_win_prob'] = display_df['nda_win_prob'].apply(lambda x: f"{x:.1%}")
             display_df.columns = ['Constituency', 'Region', 'NDA Prob', 'Classification']
             
-            st.dataframe(display_df, height=600)
+            st.table(display_df.set_index('Constituency'))
     
     def render_historical_trends(self):
         """Render historical forecast trends"""
+        import plotly.graph_objects as go
+        
         st.header("📈 Historical Forecast Trends")
         
         hist_df = self.load_historical_forecasts(days=30)
@@ -477,15 +975,7 @@ class ForecastDashboard:
         hist_df['date'] = pd.to_datetime(hist_df['date'])
         hist_df = hist_df.sort_values('date')
         
-        if 'nda_projection' in hist_df.columns:
-            # Extract mean seats and probability
-            hist_df['mean_seats'] = hist_df['nda_projection'].apply(
-                lambda x: x.get('mean_seats', 0) if isinstance(x, dict) else 0
-            )
-            hist_df['prob_majority'] = hist_df['nda_projection'].apply(
-                lambda x: x.get('probability_majority', 0) if isinstance(x, dict) else 0
-            )
-            
+        if 'mean_seats' in hist_df.columns:
             col1, col2 = st.columns(2)
             
             with col1:
@@ -534,14 +1024,17 @@ class ForecastDashboard:
         """Render data sources and quality information"""
         st.header("📊 Data Sources & Quality")
         
-        # Check for recent data files
+        # Today's data files as recorded by the pipeline in the processed data manifest
+        manifest = _load_json(self.processed_dir / "manifest.json")
+        today_files = manifest.get(datetime.today().strftime('%Y-%m-%d'), {})
+        
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.subheader("📰 News Data")
             
             # Check for recent news files
-            news_files = list(self.processed_dir.glob("*news*2025-10-17*"))
+            news_files = [self.processed_dir / name for name in today_files.get('news', [])]
             if news_files:
                 st.success(f"✅ {len(news_files)} news data files")
                 
@@ -549,14 +1042,14 @@ class ForecastDashboard:
                 try:
                     latest_news = max(news_files, key=lambda x: x.stat().st_mtime)
                     if latest_news.suffix == '.csv':
-                        news_df = pd.read_csv(latest_news)
+                        news_df = pd.read_csv(latest_news, engine='pyarrow', dtype_backend='pyarrow')
                         st.metric("Articles Processed", len(news_df))
                         
                         if 'sentiment_label' in news_df.columns:
                             sentiment_dist = news_df['sentiment_label'].value_counts()
-                            st.write("Sentiment Distribution:")
-                            for sentiment, count in sentiment_dist.items():
-                                st.write(f"- {sentiment.title()}: {count}")
+                            st.markdown("Sentiment Distribution:\n\n" + "\n".join(
+                                f"- {sentiment.title()}: {count}" for sentiment, count in sentiment_dist.items()
+                            ))
                 except Exception as e:
                     st.error(f"Error loading news data: {e}")
             else:
@@ -565,14 +1058,14 @@ class ForecastDashboard:
         with col2:
             st.subheader("📊 Poll Data")
             
-            poll_files = list(self.processed_dir.glob("*poll*2025-10-17*"))
+            poll_files = [self.processed_dir / name for name in today_files.get('polls', [])]
             if poll_files:
                 st.success(f"✅ {len(poll_files)} poll data files")
                 
                 try:
                     latest_polls = max(poll_files, key=lambda x: x.stat().st_mtime)
                     if latest_polls.suffix == '.csv':
-                        polls_df = pd.read_csv(latest_polls)
+                        polls_df = pd.read_csv(latest_polls, engine='pyarrow', dtype_backend='pyarrow')
                         st.metric("Poll Data Points", len(polls_df))
                         
                         if 'nda_vote' in polls_df.columns:
@@ -586,14 +1079,14 @@ class ForecastDashboard:
         with col3:
             st.subheader("📈 Features")
             
-            feature_files = list(self.processed_dir.glob("features*2025-10-17*"))
+            feature_files = [self.processed_dir / name for name in today_files.get('features', [])]
             if feature_files:
                 st.success(f"✅ {len(feature_files)} feature files")
                 
                 try:
                     latest_features = max(feature_files, key=lambda x: x.stat().st_mtime)
                     if latest_features.suffix == '.csv':
-                        features_df = pd.read_csv(latest_features)
+                        features_df = pd.read_csv(latest_features, engine='pyarrow', dtype_backend='pyarrow')
                         st.metric("Constituencies", len(features_df))
                         st.metric("Features", len(features_df.columns))
                 except Exception as e:
@@ -638,69 +1131,28 @@ class ForecastDashboard:
             mean_indi = 116
             others_total = 29
         
-        # Dynamic party projections based on actual forecast but with realistic ratios
-        party_data = [
-            # NDA parties with realistic distribution
-            {'Party': 'Bharatiya Janata Party', 'Code': 'BJP', 'Alliance': 'NDA', 'Expected Seats': int(mean_nda * 0.51), 'Leader': 'Sushil Kumar Modi', 'Symbol': 'Lotus', 'Color': '#FF9933'},
-            {'Party': 'Janata Dal (United)', 'Code': 'JDU', 'Alliance': 'NDA', 'Expected Seats': int(mean_nda * 0.41), 'Leader': 'Nitish Kumar', 'Symbol': 'Arrow', 'Color': '#138808'},
-            {'Party': 'Hindustani Awam Morcha', 'Code': 'HAM', 'Alliance': 'NDA', 'Expected Seats': int(mean_nda * 0.05), 'Leader': 'Jitan Ram Manjhi', 'Symbol': 'Pressure Cooker', 'Color': '#800080'},
-            {'Party': 'Vikassheel Insaan Party', 'Code': 'VIP', 'Alliance': 'NDA', 'Expected Seats': int(mean_nda * 0.03), 'Leader': 'Mukesh Sahani', 'Symbol': 'Broom', 'Color': '#FFD700'},
-            
-            # INDI parties with realistic distribution  
-            {'Party': 'Rashtriya Janata Dal', 'Code': 'RJD', 'Alliance': 'INDI', 'Expected Seats': int(mean_indi * 0.82), 'Leader': 'Tejashwi Yadav', 'Symbol': 'Lantern', 'Color': '#008000'},
-            {'Party': 'Indian National Congress', 'Code': 'INC', 'Alliance': 'INDI', 'Expected Seats': int(mean_indi * 0.13), 'Leader': 'Madan Mohan Jha', 'Symbol': 'Hand', 'Color': '#19AAED'},
-            {'Party': 'Communist Party of India (ML)', 'Code': 'CPI_ML', 'Alliance': 'INDI', 'Expected Seats': int(mean_indi * 0.05), 'Leader': 'Kunal', 'Symbol': 'Sickle', 'Color': '#FF0000'},
-            
-            # Others with fixed realistic numbers (these don't scale much)
-            {'Party': 'Jan Suraaj Party', 'Code': 'JSP', 'Alliance': 'Others', 'Expected Seats': 12, 'Leader': 'Prashant Kishor', 'Symbol': 'Torch', 'Color': '#FF6B35'},
-            {'Party': 'All India Majlis-e-Ittehadul Muslimeen', 'Code': 'AIMIM', 'Alliance': 'Others', 'Expected Seats': 4, 'Leader': 'Akhtarul Iman', 'Symbol': 'Kite', 'Color': '#00FF00'},
-            {'Party': 'Lok Janshakti Party (Secular)', 'Code': 'LJSP', 'Alliance': 'Others', 'Expected Seats': 3, 'Leader': 'Chirag Paswan', 'Symbol': 'Helicopter', 'Color': '#4169E1'},
-            {'Party': 'Bahujan Samaj Party', 'Code': 'BSP', 'Alliance': 'Others', 'Expected Seats': 2, 'Leader': 'Bharat Singh', 'Symbol': 'Elephant', 'Color': '#0000FF'},
-            {'Party': 'Others/Independents', 'Code': 'OTH', 'Alliance': 'Others', 'Expected Seats': 8, 'Leader': 'Various', 'Symbol': 'Various', 'Color': '#808080'}
-        ]
-        
-        # Display party-wise table
-        party_df = pd.DataFrame(party_data)
+        # Party tables and chart depend only on the alliance totals, so unchanged forecasts hit the cache
+        party_df, fig_party = _build_party_projections(mean_nda, mean_indi)
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.write("**🔵 NDA Alliance**")
             nda_df = party_df[party_df['Alliance'] == 'NDA']
-            st.dataframe(nda_df[['Party', 'Expected Seats', 'Leader', 'Symbol']], hide_index=True)
+            st.table(nda_df.set_index('Party')[['Expected Seats', 'Leader', 'Symbol']])
         
         with col2:
             st.write("**🔴 INDI Alliance**")
             indi_df = party_df[party_df['Alliance'] == 'INDI']
-            st.dataframe(indi_df[['Party', 'Expected Seats', 'Leader', 'Symbol']], hide_index=True)
+            st.table(indi_df.set_index('Party')[['Expected Seats', 'Leader', 'Symbol']])
         
         with col3:
             st.write("**⚪ Other Parties**")
             others_df = party_df[party_df['Alliance'] == 'Others']
-            st.dataframe(others_df[['Party', 'Expected Seats', 'Leader', 'Symbol']], hide_index=True)
+            st.table(others_df.set_index('Party')[['Expected Seats', 'Leader', 'Symbol']])
         
         # Party-wise seat distribution chart
-        fig_party = go.Figure(data=[
-            go.Bar(
-                x=party_df['Party'],
-                y=party_df['Expected Seats'],
-                marker_color=party_df['Color'],
-                text=party_df['Expected Seats'],
-                textposition='auto',
-                hovertemplate='<b>%{x}</b><br>Expected Seats: %{y}<br>Leader: %{customdata}<extra></extra>',
-                customdata=party_df['Leader']
-            )
-        ])
-        
-        fig_party.update_layout(
-            title="Party-wise Seat Projections",
-            xaxis_title="Political Parties",
-            yaxis_title="Expected Seats",
-            height=500,
-            xaxis_tickangle=-45
-        )
-        
-        st.plotly_chart(fig_party, use_container_width=True)
+        _plotly_json_chart(fig_party, height=500)
         
         # Alliance comparison
         col1, col2 = st.columns(2)
@@ -768,116 +1220,43 @@ class ForecastDashboard:
         if const_prob_df is not None and not const_prob_df.empty and 'region' in const_prob_df.columns:
             st.subheader("🗺️ Regional Party Performance")
             
-            regional_analysis = const_prob_df.groupby('region').agg({
-                'nda_win_probability': ['mean', 'count']
-            }).round(3)
-            
-            regional_analysis.columns = ['Avg_NDA_Prob', 'Total_Seats']
-            regional_analysis['Expected_NDA'] = (regional_analysis['Avg_NDA_Prob'] * regional_analysis['Total_Seats']).round(1)
-            regional_analysis['Expected_INDI'] = (regional_analysis['Total_Seats'] - regional_analysis['Expected_NDA']).round(1)
-            regional_analysis['NDA_Prob_Pct'] = (regional_analysis['Avg_NDA_Prob'] * 100).round(1)
+            regional_df = const_prob_df[['region', 'nda_win_probability']]
+            display_regional = _regional_agg(regional_df)
             
             # Display as formatted table
-            display_regional = regional_analysis[['Total_Seats', 'Expected_NDA', 'Expected_INDI', 'NDA_Prob_Pct']].copy()
-            display_regional.columns = ['Total Seats', 'Expected NDA', 'Expected INDI', 'NDA Win %']
-            
             st.dataframe(display_regional, use_container_width=True)
             
             # Regional performance chart
-            fig_regional = go.Figure()
-            
-            regions = regional_analysis.index
-            nda_expected = regional_analysis['Expected_NDA']
-            indi_expected = regional_analysis['Expected_INDI']
-            
-            fig_regional.add_trace(go.Bar(
-                name='NDA Expected',
-                x=regions,
-                y=nda_expected,
-                marker_color='#FF9933'
-            ))
-            
-            fig_regional.add_trace(go.Bar(
-                name='INDI Expected',
-                x=regions,
-                y=indi_expected,
-                marker_color='#138808'
-            ))
-            
-            fig_regional.update_layout(
-                title="Expected Seats by Region",
-                xaxis_title="Region",
-                yaxis_title="Expected Seats",
-                barmode='stack',
-                height=400
-            )
-            
-            st.plotly_chart(fig_regional, use_container_width=True)
+            _plotly_json_chart(_build_regional_fig(regional_df), height=400)
     
     def render_constituency_details(self, const_prob_df):
         """Render detailed constituency-wise analysis with enhanced highlighting"""
         
-        # Enhanced header with highlighting
-        st.markdown("""
-        <div style="background: linear-gradient(90deg, #FF6B35 0%, #F7931E 100%); 
-                    padding: 1.5rem; border-radius: 10px; margin-bottom: 2rem;">
-            <h1 style="color: white; text-align: center; margin: 0; font-size: 2.5rem;">
-                🏛️ CONSTITUENCY DETAILS - DEEP DIVE ANALYSIS
-            </h1>
-            <p style="color: white; text-align: center; margin: 0.5rem 0 0 0; font-size: 1.2rem;">
-                Complete candidate-wise analysis for all 243 Bihar constituencies
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Enhanced header and key highlights banner
+        st.markdown(CONSTITUENCY_DETAILS_HEADER_HTML, unsafe_allow_html=True)
         
-        # Key highlights banner
-        st.markdown("""
-        <div style="background: #E3F2FD; border-left: 5px solid #2196F3; padding: 1rem; margin-bottom: 2rem;">
-            <h3 style="color: #1976D2; margin: 0;">🎯 What You'll Find Here:</h3>
-            <ul style="margin: 0.5rem 0 0 0; color: #1976D2;">
-                <li><strong>Detailed Candidate Matchups:</strong> Head-to-head analysis with winning chances</li>
-                <li><strong>Historical Context:</strong> Previous election results and trends</li>
-                <li><strong>Demographics:</strong> Voter composition and regional factors</li>
-                <li><strong>Complete Coverage:</strong> All 243 constituencies with filtering options</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Import candidate data
-        try:
-            from src.data.constituency_candidates import constituency_analyzer
-        except ImportError:
+        # Candidate data
+        if get_analyzer() is None:
             st.error("Candidate data not available")
             return
         
         if const_prob_df is None or const_prob_df.empty:
-            st.markdown("""
-            <div style="background: #E3F2FD; border: 2px solid #2196F3; border-radius: 10px; padding: 1.5rem; margin: 1rem 0;">
-                <h3 style="color: #1565C0; margin: 0 0 1rem 0;">📊 Constituency Data Not Available</h3>
-                <p style="color: #0D47A1; margin: 0;">
-                    Run the data pipeline to generate constituency-level forecasts and detailed candidate analysis.
-                </p>
-                <p style="color: #1976D2; margin: 0.5rem 0 0 0; font-weight: bold;">
-                    Command: <code>python main.py update</code>
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(CONSTITUENCY_DATA_MISSING_HTML, unsafe_allow_html=True)
             return
         
+        # Each panel is its own fragment, so a widget change only reruns the panel it belongs to
+        st.fragment(self.render_candidate_matchups)()
+        st.fragment(self.render_constituencies_summary)()
+        self._render_fragment(None, self.render_constituency_forecasts, 'const_prob_df')
+    
+    def render_candidate_matchups(self):
+        """Render the constituency selector and the candidate matchup for the selection"""
         # Enhanced Candidate Analysis Section
-        st.markdown("""
-        <div style="background: #FFF3E0; border: 2px solid #FF9800; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
-            <h2 style="color: #E65100; margin: 0;">🏛️ DETAILED CANDIDATE MATCHUPS</h2>
-            <p style="color: #BF360C; margin: 0.5rem 0 0 0;">Select any constituency for complete candidate analysis</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(CONSTITUENCY_SECTION_HTML['matchups'], unsafe_allow_html=True)
         
         # Enhanced constituency selection
         try:
-            all_constituencies = list(constituency_analyzer.constituencies.keys())
-            
-            # Sort constituencies alphabetically
-            all_constituencies.sort()
+            all_constituencies = constituency_names()
             
             # Create search and selection interface
             col1, col2 = st.columns([2, 1])
@@ -900,128 +1279,54 @@ class ForecastDashboard:
             selected_const = None
         
         if selected_const:
-            matchup = constituency_analyzer.get_candidate_matchup(selected_const)
+            matchup = get_matchup(selected_const)
             
             if matchup:
                 # Enhanced constituency header with highlighting
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #4CAF50 0%, #45A049 100%); 
-                            color: white; padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
-                    <h2 style="margin: 0; text-align: center;">🏛️ {selected_const.upper()}</h2>
-                    <p style="margin: 0.5rem 0 0 0; text-align: center; font-size: 1.1rem;">
-                        {matchup['region']} Region • {matchup['battle_type']} • {matchup['key_contest']}
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CONSTITUENCY_BANNER_HTML.format_map({
+                    'name': selected_const.upper(),
+                    'region': matchup['region'],
+                    'battle_type': matchup['battle_type'],
+                    'key_contest': matchup['key_contest']
+                }), unsafe_allow_html=True)
                 
                 # Key constituency metrics with highlighting
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.markdown("""
-                    <div style="background: #E8F5E8; border: 2px solid #4CAF50; border-radius: 8px; padding: 1rem; text-align: center;">
-                        <h3 style="color: #2E7D32; margin: 0;">{}</h3>
-                        <p style="color: #388E3C; margin: 0;">Constituency Code</p>
-                    </div>
-                    """.format(matchup['constituency_code']), unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown("""
-                    <div style="background: #FFF3E0; border: 2px solid #FF9800; border-radius: 8px; padding: 1rem; text-align: center;">
-                        <h3 style="color: #E65100; margin: 0;">{}</h3>
-                        <p style="color: #F57C00; margin: 0;">Region</p>
-                    </div>
-                    """.format(matchup['region']), unsafe_allow_html=True)
-                
-                with col3:
-                    st.markdown("""
-                    <div style="background: #E3F2FD; border: 2px solid #2196F3; border-radius: 8px; padding: 1rem; text-align: center;">
-                        <h3 style="color: #1565C0; margin: 0;">{}</h3>
-                        <p style="color: #1976D2; margin: 0;">Total Candidates</p>
-                    </div>
-                    """.format(matchup['total_candidates']), unsafe_allow_html=True)
-                
-                with col4:
-                    st.markdown("""
-                    <div style="background: #FCE4EC; border: 2px solid #E91E63; border-radius: 8px; padding: 1rem; text-align: center;">
-                        <h3 style="color: #AD1457; margin: 0;">{}</h3>
-                        <p style="color: #C2185B; margin: 0;">Battle Type</p>
-                    </div>
-                    """.format(matchup['battle_type']), unsafe_allow_html=True)
+                info_values = (matchup['constituency_code'], matchup['region'], matchup['total_candidates'], matchup['battle_type'])
+                st.markdown(_metric_cards(INFO_CARD_STYLES, info_values), unsafe_allow_html=True)
                 
                 # Enhanced candidate comparison section
-                st.markdown("""
-                <div style="background: #F3E5F5; border: 2px solid #9C27B0; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
-                    <h2 style="color: #6A1B9A; margin: 0;">👥 CANDIDATE vs CANDIDATE ANALYSIS</h2>
-                    <p style="color: #7B1FA2; margin: 0.5rem 0 0 0;">Complete head-to-head comparison with winning chances</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CONSTITUENCY_SECTION_HTML['candidates'], unsafe_allow_html=True)
                 
-                # Enhanced candidate cards display
-                for i, candidate in enumerate(matchup['candidates']):
-                    # Determine card styling based on position
-                    if i == 0:
-                        card_color = "#4CAF50"
-                        bg_color = "#E8F5E8"
-                        status_icon = "🥇"
-                        status_text = "EXPECTED WINNER"
-                    elif i == 1:
-                        card_color = "#FF9800"
-                        bg_color = "#FFF3E0"
-                        status_icon = "🥈"
-                        status_text = "MAIN CHALLENGER"
-                    else:
-                        card_color = "#9E9E9E"
-                        bg_color = "#F5F5F5"
-                        status_icon = "🥉"
-                        status_text = f"CHALLENGER #{i}"
-                    
-                    st.markdown(f"""
-                    <div style="background: {bg_color}; border: 3px solid {card_color}; border-radius: 10px; padding: 1.5rem; margin: 1rem 0;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h3 style="color: {card_color}; margin: 0;">{status_icon} {candidate['name']}</h3>
-                            <span style="background: {card_color}; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-weight: bold;">
-                                {status_text}
-                            </span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;">
-                            <div><strong>Party:</strong> {candidate['party_name']} ({candidate['party_code']})</div>
-                            <div><strong>Alliance:</strong> {candidate['alliance']}</div>
-                            <div><strong>Win Chance:</strong> <span style="color: {card_color}; font-weight: bold;">{candidate['winning_chances']:.1f}%</span></div>
-                            <div><strong>Age:</strong> {candidate['age']} years</div>
-                            <div><strong>Education:</strong> {candidate['education']}</div>
-                            <div><strong>Assets:</strong> {candidate['assets']}</div>
-                            <div><strong>Criminal Cases:</strong> {candidate['criminal_cases']}</div>
-                            <div><strong>Experience:</strong> {candidate['experience']}</div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Enhanced candidate cards display, sent to the frontend as one block
+                candidate_cards = [
+                    CANDIDATE_CARD_HTML.format_map({**candidate, **rank_style(i)})
+                    for i, candidate in enumerate(matchup['candidates'])
+                ]
+                st.markdown("\n".join(candidate_cards), unsafe_allow_html=True)
                 
                 # Also show traditional table for easy comparison
-                st.markdown("""
-                <div style="background: #ECEFF1; border: 2px solid #607D8B; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
-                    <h3 style="color: #37474F; margin: 0;">📊 QUICK COMPARISON TABLE</h3>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CONSTITUENCY_SECTION_HTML['comparison'], unsafe_allow_html=True)
                 
-                candidates_data = []
-                for i, candidate in enumerate(matchup['candidates']):
-                    status = "🥇 Expected Winner" if i == 0 else f"🥈 Challenger #{i}"
-                    
-                    candidates_data.append({
-                        'Status': status,
-                        'Candidate': candidate['name'],
-                        'Party': f"{candidate['party_name']} ({candidate['party_code']})",
-                        'Alliance': candidate['alliance'],
-                        'Win Chance': f"{candidate['winning_chances']:.1f}%",
-                        'Age': candidate['age'],
-                        'Education': candidate['education'],
-                        'Assets': candidate['assets'],
-                        'Criminal Cases': candidate['criminal_cases'],
-                        'Experience': candidate['experience']
-                    })
-                
-                candidates_df = pd.DataFrame(candidates_data)
+                candidates_df = pd.DataFrame.from_records(matchup['candidates'])
+                candidates_df['Status'] = np.where(
+                    candidates_df.index == 0,
+                    "🥇 Expected Winner",
+                    "🥈 Challenger #" + candidates_df.index.astype(str)
+                )
+                candidates_df['Party'] = candidates_df['party_name'] + " (" + candidates_df['party_code'] + ")"
+                candidates_df['Win Chance'] = candidates_df['winning_chances'].map('{:.1f}%'.format)
+                candidates_df = candidates_df.rename(columns={
+                    'name': 'Candidate',
+                    'alliance': 'Alliance',
+                    'age': 'Age',
+                    'education': 'Education',
+                    'assets': 'Assets',
+                    'criminal_cases': 'Criminal Cases',
+                    'experience': 'Experience'
+                })[[
+                    'Status', 'Candidate', 'Party', 'Alliance', 'Win Chance', 'Age',
+                    'Education', 'Assets', 'Criminal Cases', 'Experience'
+                ]]
                 st.dataframe(
                     candidates_df, 
                     hide_index=True, 
@@ -1038,51 +1343,18 @@ class ForecastDashboard:
                 )
                 
                 # Enhanced candidate strengths and challenges
-                st.markdown("""
-                <div style="background: #E1F5FE; border: 2px solid #0288D1; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
-                    <h2 style="color: #01579B; margin: 0;">💪 CANDIDATE STRENGTHS & CHALLENGES</h2>
-                    <p style="color: #0277BD; margin: 0.5rem 0 0 0;">Detailed SWOT analysis for top candidates</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CONSTITUENCY_SECTION_HTML['strengths'], unsafe_allow_html=True)
                 
                 for i, candidate in enumerate(matchup['candidates'][:3]):  # Top 3 candidates
-                    # Color coding for different candidates
-                    if i == 0:
-                        border_color = "#4CAF50"
-                        bg_color = "#E8F5E8"
-                    elif i == 1:
-                        border_color = "#FF9800"
-                        bg_color = "#FFF3E0"
-                    else:
-                        border_color = "#9E9E9E"
-                        bg_color = "#F5F5F5"
-                    
                     with st.expander(f"🔍 {candidate['name']} ({candidate['party_code']}) - Detailed Analysis", expanded=(i==0)):
-                        st.markdown(f"""
-                        <div style="background: {bg_color}; border: 2px solid {border_color}; border-radius: 8px; padding: 1rem; margin: 0.5rem 0;">
-                        """, unsafe_allow_html=True)
-                        
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.markdown("### ✅ **STRENGTHS**")
-                            for strength in candidate['strengths']:
-                                st.markdown(f"- ✅ **{strength}**")
-                        
-                        with col2:
-                            st.markdown("### ⚠️ **CHALLENGES**")
-                            for challenge in candidate['challenges']:
-                                st.markdown(f"- ⚠️ **{challenge}**")
-                        
-                        st.markdown("</div>", unsafe_allow_html=True)
+                        st.markdown(SWOT_PANEL_HTML.format_map({
+                            **rank_style(i),
+                            'strengths': "".join(f"<li>✅ <strong>{strength}</strong></li>" for strength in candidate['strengths']),
+                            'challenges': "".join(f"<li>⚠️ <strong>{challenge}</strong></li>" for challenge in candidate['challenges'])
+                        }), unsafe_allow_html=True)
                 
                 # Enhanced historical context
-                st.markdown("""
-                <div style="background: #FFF8E1; border: 2px solid #FFC107; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
-                    <h2 style="color: #F57F17; margin: 0;">📊 HISTORICAL CONTEXT & DEMOGRAPHICS</h2>
-                    <p style="color: #FF8F00; margin: 0.5rem 0 0 0;">Past election results and voter composition analysis</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CONSTITUENCY_SECTION_HTML['history'], unsafe_allow_html=True)
                 
                 hist_context = matchup['historical_context']
                 demographics = matchup['demographics']
@@ -1090,96 +1362,70 @@ class ForecastDashboard:
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    st.markdown("""
-                    <div style="background: #E8F5E8; border: 2px solid #4CAF50; border-radius: 8px; padding: 1.5rem;">
-                        <h3 style="color: #2E7D32; margin: 0 0 1rem 0;">🏆 PREVIOUS ELECTION RESULTS</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(CONSTITUENCY_SECTION_HTML['previous_results'], unsafe_allow_html=True)
                     
-                    st.metric("2020 Winner", f"{hist_context['last_winner']}")
-                    st.metric("Winning Party", f"{hist_context['last_party']}")
-                    st.metric("Victory Margin", f"{hist_context['last_margin']:,} votes")
+                    previous_values = (hist_context['last_winner'], hist_context['last_party'], f"{hist_context['last_margin']:,} votes")
+                    st.markdown(_metric_cards(PREVIOUS_RESULT_CARD_STYLES, previous_values), unsafe_allow_html=True)
                     
                     # Trend indicator
                     trend_color = "#4CAF50" if "Stable" in hist_context['trend'] else "#FF9800"
-                    st.markdown(f"""
-                    <div style="background: {trend_color}; color: white; padding: 0.5rem; border-radius: 5px; text-align: center; margin: 1rem 0;">
-                        <strong>Trend: {hist_context['trend']}</strong>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(TREND_BADGE_HTML.format_map({'trend_color': trend_color, 'trend': hist_context['trend']}), unsafe_allow_html=True)
                     
                     st.markdown(f"**🎯 Swing Potential:** {hist_context['swing_potential']}")
                 
                 with col2:
-                    st.markdown("""
-                    <div style="background: #E3F2FD; border: 2px solid #2196F3; border-radius: 8px; padding: 1.5rem;">
-                        <h3 style="color: #1565C0; margin: 0 0 1rem 0;">👥 VOTER DEMOGRAPHICS</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.metric("Total Voters", f"{demographics['total_voters']:,}")
-                    
-                    # Gender breakdown
-                    col2a, col2b = st.columns(2)
-                    with col2a:
-                        st.metric("Male Voters", f"{demographics['male_voters']:,}")
-                    with col2b:
-                        st.metric("Female Voters", f"{demographics['female_voters']:,}")
+                    st.markdown(CONSTITUENCY_SECTION_HTML['demographics'], unsafe_allow_html=True)
                     
-                    # Urban/Rural and literacy
-                    col2c, col2d = st.columns(2)
-                    with col2c:
-                        st.metric("Urban %", f"{demographics['urban_percentage']:.1f}%")
-                    with col2d:
-                        st.metric("Literacy Rate", f"{demographics['literacy_rate']:.1f}%")
-        
-        # Enhanced divider
-        st.markdown("""
-        <div style="height: 3px; background: linear-gradient(90deg, #FF6B35 0%, #F7931E 50%, #FF6B35 100%); 
-                    margin: 3rem 0; border-radius: 2px;"></div>
-        """, unsafe_allow_html=True)
-        
-        # Enhanced all constituencies summary
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #673AB7 0%, #9C27B0 100%); 
-                    color: white; padding: 1.5rem; border-radius: 10px; margin: 2rem 0;">
-            <h1 style="margin: 0; text-align: center;">📋 ALL CONSTITUENCIES SUMMARY</h1>
-            <p style="margin: 0.5rem 0 0 0; text-align: center; font-size: 1.1rem;">
-                Complete overview of all 243 Bihar constituencies with advanced filtering
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+                    # Voter counts, gender breakdown, urban share and literacy as one table
+                    demographics_df = pd.DataFrame({
+                        'Metric': ['Total Voters', 'Male Voters', 'Female Voters', 'Urban %', 'Literacy Rate'],
+                        'Value': [
+                            f"{demographics['total_voters']:,}",
+                            f"{demographics['male_voters']:,}",
+                            f"{demographics['female_voters']:,}",
+                            f"{demographics['urban_percentage']:.1f}%",
+                            f"{demographics['literacy_rate']:.1f}%"
+                        ]
+                    })
+                    st.table(demographics_df.set_index('Metric'))
+    
+    def render_constituencies_summary(self):
+        """Render the filterable candidate summary for all constituencies"""
+        # Enhanced divider and all constituencies summary header
+        st.markdown(CONSTITUENCY_SUMMARY_HEADER_HTML, unsafe_allow_html=True)
         
         try:
-            summary_df = constituency_analyzer.get_all_constituencies_summary()
+            summary_df = _load_constituency_summary()
             
             if summary_df is not None and not summary_df.empty:
                 # Add filters
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    regions = ['All'] + sorted(summary_df['region'].unique().tolist())
+                    regions = _filter_options(summary_df['region'])
                     selected_region = st.selectbox("Filter by Region", regions, key="region_filter")
                 
                 with col2:
-                    parties = ['All'] + sorted(summary_df['winner_party'].unique().tolist())
+                    parties = _filter_options(summary_df['winner_party'])
                     selected_party = st.selectbox("Filter by Expected Winner Party", parties, key="party_filter")
                 
                 with col3:
-                    contest_types = ['All'] + sorted(summary_df['contest_margin'].unique().tolist())
+                    contest_types = _filter_options(summary_df['contest_margin'])
                     selected_contest = st.selectbox("Filter by Contest Type", contest_types, key="contest_filter")
                 
-                # Apply filters
-                filtered_summary = summary_df.copy()
+                # Apply filters as one combined mask
+                summary_mask = np.ones(len(summary_df), dtype=bool)
                 
                 if selected_region != 'All':
-                    filtered_summary = filtered_summary[filtered_summary['region'] == selected_region]
+                    summary_mask &= summary_df['region'].eq(selected_region).to_numpy()
                 
                 if selected_party != 'All':
-                    filtered_summary = filtered_summary[filtered_summary['winner_party'] == selected_party]
+                    summary_mask &= summary_df['winner_party'].eq(selected_party).to_numpy()
                 
                 if selected_contest != 'All':
-                    filtered_summary = filtered_summary[filtered_summary['contest_margin'] == selected_contest]
+                    summary_mask &= summary_df['contest_margin'].eq(selected_contest).to_numpy()
+                
+                filtered_summary = summary_df if summary_mask.all() else summary_df.loc[summary_mask]
                 
                 st.write(f"**Showing {len(filtered_summary)} constituencies**")
                 
@@ -1212,24 +1458,24 @@ class ForecastDashboard:
                 # Summary statistics
                 st.subheader("📈 Summary Statistics")
                 
+                alliance_counts = filtered_summary['winner_alliance'].value_counts()
+                close_contests = int(filtered_summary['contest_margin'].eq('Close').sum())
+                incumbents_winning = int(
+                    (filtered_summary['expected_winner'].to_numpy() == filtered_summary['last_winner'].to_numpy()).sum()
+                )
+                
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
-                    close_contests = len(filtered_summary[filtered_summary['contest_margin'] == 'Close'])
                     st.metric("Close Contests", close_contests)
                 
                 with col2:
-                    nda_leading = len(filtered_summary[filtered_summary['winner_alliance'] == 'NDA'])
-                    st.metric("NDA Leading", nda_leading)
+                    st.metric("NDA Leading", int(alliance_counts.get('NDA', 0)))
                 
                 with col3:
-                    indi_leading = len(filtered_summary[filtered_summary['winner_alliance'] == 'INDI'])
-                    st.metric("INDI Leading", indi_leading)
+                    st.metric("INDI Leading", int(alliance_counts.get('INDI', 0)))
                 
                 with col4:
-                    incumbents_winning = len(filtered_summary[
-                        filtered_summary['expected_winner'] == filtered_summary['last_winner']
-                    ])
                     st.metric("Incumbents Retaining", incumbents_winning)
             
             else:
@@ -1237,53 +1483,43 @@ class ForecastDashboard:
         
         except Exception as e:
             st.error(f"Error loading constituency summary: {e}")
+    
+    def render_constituency_forecasts(self, const_prob_df):
+        """Render the filterable constituency forecast table, map and statistics"""
+        if const_prob_df is None or const_prob_df.empty:
+            return
+        
+        if 'classification' not in const_prob_df.columns:
+            const_prob_df = _add_classification(const_prob_df)
         
         # Filters
         col1, col2, col3 = st.columns(3)
         
         with col1:
             # Region filter
-            regions = ['All'] + sorted(const_prob_df['region'].unique().tolist())
+            regions = _filter_options(const_prob_df['region'])
             selected_region = st.selectbox("Filter by Region", regions)
         
         with col2:
-            # Classification filter - create classification if it doesn't exist
-            if 'classification' not in const_prob_df.columns:
-                # Create classification based on probability
-                const_prob_df['classification'] = pd.cut(
-                    const_prob_df['nda_win_probability'],
-                    bins=[0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                    labels=['Safe INDI', 'Likely INDI', 'Toss-up', 'Likely NDA', 'Safe NDA']
-                )
-            
-            classifications = ['All'] + sorted(const_prob_df['classification'].unique().tolist())
+            # Classification filter
+            classifications = _filter_options(const_prob_df['classification'])
             selected_class = st.selectbox("Filter by Classification", classifications)
         
         with col3:
             # Probability range
             prob_range = st.slider("NDA Win Probability Range", 0.0, 1.0, (0.0, 1.0), 0.05)
         
-        # Apply filters
-        filtered_df = const_prob_df.copy()
-        
-        # Ensure classification column exists
-        if 'classification' not in filtered_df.columns:
-            filtered_df['classification'] = pd.cut(
-                filtered_df['nda_win_probability'],
-                bins=[0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                labels=['Safe INDI', 'Likely INDI', 'Toss-up', 'Likely NDA', 'Safe NDA']
-            )
+        # Apply filters as one combined mask
+        probs = const_prob_df['nda_win_probability'].to_numpy()
+        mask = (probs >= prob_range[0]) & (probs <= prob_range[1])
         
         if selected_region != 'All':
-            filtered_df = filtered_df[filtered_df['region'] == selected_region]
+            mask &= const_prob_df['region'].eq(selected_region).to_numpy()
         
         if selected_class != 'All':
-            filtered_df = filtered_df[filtered_df['classification'] == selected_class]
+            mask &= const_prob_df['classification'].eq(selected_class).to_numpy()
         
-        filtered_df = filtered_df[
-            (filtered_df['nda_win_probability'] >= prob_range[0]) & 
-            (filtered_df['nda_win_probability'] <= prob_range[1])
-        ]
+        filtered_df = const_prob_df if mask.all() else const_prob_df.loc[mask]
         
         st.write(f"**Showing {len(filtered_df)} constituencies**")
         
@@ -1294,15 +1530,7 @@ class ForecastDashboard:
             if 'classification' in filtered_df.columns:
                 display_columns.append('classification')
             
-            display_df = filtered_df[display_columns].copy()
-            display_df['nda_win_probability'] = display_df['nda_win_probability'].apply(lambda x: f"{x:.1%}")
-            display_df = display_df.sort_values('nda_win_probability', ascending=False)
-            
-            column_names = ['Constituency', 'Region', 'NDA Win Prob']
-            if 'classification' in display_df.columns:
-                column_names.append('Classification')
-            
-            display_df.columns = column_names
+            display_df = _constituency_display_table(filtered_df[display_columns])
             
             st.dataframe(display_df, use_container_width=True, height=400)
             
@@ -1310,82 +1538,31 @@ class ForecastDashboard:
             st.subheader("🗺️ Constituency Map View")
             
             # Create a scatter plot as a simple map representation
-            fig_map = go.Figure()
-            
-            # Color mapping for classifications
-            color_map = {
-                'Safe NDA': '#8B0000',
-                'Likely NDA': '#FF4500', 
-                'Toss-up': '#FFD700',
-                'Likely INDI': '#4169E1',
-                'Safe INDI': '#000080'
-            }
-            
-            if 'classification' in filtered_df.columns:
-                for classification in filtered_df['classification'].unique():
-                    class_data = filtered_df[filtered_df['classification'] == classification]
-                    
-                    fig_map.add_trace(go.Scatter(
-                        x=list(range(len(class_data))),  # Convert range to list
-                        y=class_data['nda_win_probability'],
-                        mode='markers',
-                        name=str(classification),
-                        marker=dict(
-                            color=color_map.get(str(classification), '#808080'),
-                            size=10,
-                            opacity=0.7
-                        ),
-                        text=class_data['constituency'],
-                        hovertemplate='<b>%{text}</b><br>NDA Prob: %{y:.1%}<extra></extra>'
-                    ))
-            else:
-                # Simple scatter plot without classification
-                fig_map.add_trace(go.Scatter(
-                    x=list(range(len(filtered_df))),  # Convert range to list
-                    y=filtered_df['nda_win_probability'],
-                    mode='markers',
-                    name='Constituencies',
-                    marker=dict(
-                        color='#4169E1',
-                        size=10,
-                        opacity=0.7
-                    ),
-                    text=filtered_df['constituency'],
-                    hovertemplate='<b>%{text}</b><br>NDA Prob: %{y:.1%}<extra></extra>'
-                ))
-            
-            fig_map.add_hline(y=0.5, line_dash="dash", line_color="black", annotation_text="50% (Even)")
-            
-            fig_map.update_layout(
-                title="Constituency Win Probabilities",
-                xaxis_title="Constituency Index",
-                yaxis_title="NDA Win Probability",
-                height=500,
-                showlegend=True
-            )
-            
-            st.plotly_chart(fig_map, use_container_width=True)
+            map_columns = [c for c in ('constituency', 'nda_win_probability', 'classification') if c in filtered_df.columns]
+            _plotly_json_chart(_build_constituency_map_fig(filtered_df[map_columns]), height=500)
             
             # Summary statistics for filtered data
             st.subheader("📊 Summary Statistics")
             
+            probs = filtered_df['nda_win_probability'].to_numpy(dtype=float)
+            
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                avg_prob = filtered_df['nda_win_probability'].mean()
+                avg_prob = probs.mean()
                 st.metric("Average NDA Prob", f"{avg_prob:.1%}")
             
             with col2:
-                nda_favored = (filtered_df['nda_win_probability'] > 0.5).sum()
+                nda_favored = np.count_nonzero(probs > 0.5)
                 st.metric("NDA Favored", f"{nda_favored}/{len(filtered_df)}")
             
             with col3:
-                indi_favored = (filtered_df['nda_win_probability'] < 0.5).sum()
+                indi_favored = np.count_nonzero(probs < 0.5)
                 st.metric("INDI Favored", f"{indi_favored}/{len(filtered_df)}")
             
             with col4:
-                very_close = ((filtered_df['nda_win_probability'] >= 0.45) & 
-                             (filtered_df['nda_win_probability'] <= 0.55)).sum()
+                # Within 5 points of even in one pass; the eps keeps rounded 0.45/0.55 inclusive
+                very_close = np.count_nonzero(np.abs(probs - 0.5) <= 0.05 + np.finfo(np.float64).eps)
                 st.metric("Very Close", f"{very_close}/{len(filtered_df)}")
         
         else:
@@ -1403,11 +1580,8 @@ class ForecastDashboard:
         
         with col1:
             # Forecast summary
-            summary_file = latest_dir / "forecast_summary.json"
-            if summary_file.exists():
-                with open(summary_file) as f:
-                    summary_data = f.read()
-                
+            summary_data = _load_bytes(latest_dir / "forecast_summary.json")
+            if summary_data is not None:
                 st.download_button(
                     "📊 Forecast Summary (JSON)",
                     summary_data,
@@ -1417,28 +1591,22 @@ class ForecastDashboard:
         
         with col2:
             # Marginal seats
-            marginal_file = latest_dir / "marginal_seats.csv"
-            if marginal_file.exists():
-                marginal_data = pd.read_csv(marginal_file)
-                csv_data = marginal_data.to_csv(index=False)
-                
+            marginal_data = _load_bytes(latest_dir / "marginal_seats.csv")
+            if marginal_data is not None:
                 st.download_button(
                     "🎯 Marginal Seats (CSV)",
-                    csv_data,
+                    marginal_data,
                     f"marginal_seats_{latest_dir.name}.csv",
                     "text/csv"
                 )
         
         with col3:
             # Constituency probabilities
-            const_prob_file = latest_dir / "constituency_probabilities.csv"
-            if const_prob_file.exists():
-                const_prob_data = pd.read_csv(const_prob_file)
-                csv_data = const_prob_data.to_csv(index=False)
-                
+            const_prob_data = _load_bytes(latest_dir / "constituency_probabilities.csv")
+            if const_prob_data is not None:
                 st.download_button(
                     "📊 All Constituencies (CSV)",
-                    csv_data,
+                    const_prob_data,
                     f"constituency_probabilities_{latest_dir.name}.csv",
                     "text/csv"
                 )
@@ -1457,13 +1625,22 @@ class ForecastDashboard:
         </div>
         """, unsafe_allow_html=True)
     
+    def _render_fragment(self, run_every, render_func, *fields):
+        """Run render_func as a fragment that re-reads the cached latest results on every run"""
+        def fragment():
+            results = dict(zip(RESULT_FIELDS, self.load_latest_results()))
+            render_func(*(results[field] for field in fields))
+        
+        st.fragment(fragment, run_every=run_every)()
+    
     def render(self):
         """Render the complete dashboard"""
         # Load data
         summary, marginal_df, const_prob_df, sim_summary, latest_dir = self.load_latest_results()
         
-        # Render header
-        self.render_header()
+        # Render header; auto-refresh re-runs only the data-heavy sections as fragments
+        auto_refresh = self.render_header()
+        run_every = "30s" if auto_refresh else None
         
         # Render sidebar
         self.render_sidebar(summary, latest_dir)
@@ -1481,19 +1658,19 @@ class ForecastDashboard:
         with tab1:
             self.render_main_metrics(summary)
             st.divider()
-            self.render_seat_distribution(summary, sim_summary)
+            self._render_fragment(run_every, self.render_seat_distribution, 'summary', 'sim_summary')
         
         with tab2:
-            self.render_party_analysis(summary, const_prob_df)
+            self._render_fragment(run_every, self.render_party_analysis, 'summary', 'const_prob_df')
         
         with tab3:
-            self.render_marginal_seats(marginal_df)
+            self._render_fragment(run_every, self.render_marginal_seats, 'marginal_df')
         
         with tab4:
             self.render_constituency_details(const_prob_df)
         
         with tab5:
-            self.render_historical_trends()
+            self._render_fragment(run_every, self.render_historical_trends)
         
         with tab6:
             self.render_download_section(latest_dir)
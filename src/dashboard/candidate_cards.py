@@ -0,0 +1,40 @@
+"""
+Candidate card templates and rank styles shared by the Advanced and ECI dashboards
+"""
+
+# Candidate card, filled with str.format_map from a candidate dict merged with rank_style()
+CANDIDATE_CARD_HTML = """<div style="background: {bg_color}; border: 3px solid {card_color}; border-radius: 10px; padding: 1.5rem; margin: 1rem 0;">
+<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+<h3 style="color: {card_color}; margin: 0;">{status_icon} {name}</h3>
+<span style="background: {card_color}; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-weight: bold;">{status_text}</span>
+</div>
+<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;">
+<div><strong>Party:</strong> {party_name} ({party_code})</div>
+<div><strong>Alliance:</strong> {alliance}</div>
+<div><strong>Win Chance:</strong> <span style="color: {card_color}; font-weight: bold;">{winning_chances:.1f}%</span></div>
+<div><strong>Age:</strong> {age} years</div>
+<div><strong>Education:</strong> {education}</div>
+<div><strong>Assets:</strong> {assets}</div>
+<div><strong>Criminal Cases:</strong> {criminal_cases}</div>
+<div><strong>Experience:</strong> {experience}</div>
+</div>
+</div>"""
+
+TREND_BADGE_HTML = """
+<div style="background: {trend_color}; color: white; padding: 0.5rem; border-radius: 5px; text-align: center; margin: 1rem 0;">
+    <strong>Trend: {trend}</strong>
+</div>
+"""
+
+# Card colours by candidate rank: expected winner, main challenger, everyone else
+CANDIDATE_RANK_STYLES = (
+    {'card_color': '#4CAF50', 'bg_color': '#E8F5E8', 'status_icon': '🥇', 'status_text': 'EXPECTED WINNER'},
+    {'card_color': '#FF9800', 'bg_color': '#FFF3E0', 'status_icon': '🥈', 'status_text': 'MAIN CHALLENGER'},
+    {'card_color': '#9E9E9E', 'bg_color': '#F5F5F5', 'status_icon': '🥉', 'status_text': 'CHALLENGER #{rank}'},
+)
+
+
+def rank_style(rank: int) -> dict:
+    """Card colours and status label for the candidate at the given 0-based rank"""
+    style = CANDIDATE_RANK_STYLES[min(rank, 2)]
+    return {**style, 'status_text': style['status_text'].format(rank=rank)}
@@ -0,0 +1,27 @@
+"""
+Cached constituency candidate lookups shared by the Advanced and ECI dashboards
+"""
+
+import streamlit as st
+
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer():
+    """Shared constituency candidate analyzer, imported once per process; None if unavailable"""
+    try:
+        from src.data.constituency_candidates import constituency_analyzer
+    except ImportError:
+        return None
+    return constituency_analyzer
+
+
+@st.cache_data(ttl=3600, max_entries=243, show_spinner=False)
+def get_matchup(name: str) -> dict:
+    """Candidate matchup for one constituency, kept per name for repeat selections"""
+    return get_analyzer().get_candidate_matchup(name)
+
+
+@st.cache_resource(show_spinner=False)
+def constituency_names() -> tuple:
+    """Alphabetized constituency names for the selectors (immutable, shared across sessions)"""
+    return tuple(sorted(get_analyzer().constituencies.keys()))
@@ -4,9 +4,171 @@ Shared constituency details component for both ECI and Advanced dashboard styles
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 from datetime import datetime
 
+from src.dashboard.candidate_cards import CANDIDATE_CARD_HTML, TREND_BADGE_HTML, rank_style
+from src.dashboard.constituency_cache import get_analyzer, get_matchup, constituency_names
+
+
+# Static section blocks and templates, filled with str.format_map at render time
+SELECTOR_HEADER_HTML = """
+<div style="background: #f8f9fa; border: 2px solid #1f4e79; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
+    <h3 style="color: #1f4e79; margin: 0 0 1rem 0;">Select Constituency for Detailed Analysis</h3>
+</div>
+"""
+
+ECI_HEADER_HTML = """
+<div class="eci-table">
+    <div class="eci-table-header">
+        {name} - CANDIDATE ANALYSIS
+    </div>
+</div>
+"""
+
+ADVANCED_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #4CAF50 0%, #45A049 100%); 
+            color: white; padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
+    <h2 style="margin: 0; text-align: center;">🏛️ {name}</h2>
+    <p style="margin: 0.5rem 0 0 0; text-align: center; font-size: 1.1rem;">
+        {region} Region • {battle_type} • {key_contest}
+    </p>
+</div>
+"""
+
+METRIC_GRID_HTML = '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">{cards}</div>'
+ECI_SUMMARY_BOX_HTML = '<div class="eci-summary-box"><strong>{label}</strong><br>{value}</div>'
+# Header metric cards: matchup key, ECI label, advanced label and colour
+HEADER_METRICS = (
+    ('constituency_code', "Constituency Code", "Constituency Code", "#4CAF50"),
+    ('region', "Region", "Region", "#FF9800"),
+    ('total_candidates', "Total Candidates", "Total Candidates", "#2196F3"),
+    ('battle_type', "Contest Type", "Battle Type", "#E91E63"),
+)
+METRIC_CARD_HTML = (
+    '<div style="background: {color}20; border: 2px solid {color}; border-radius: 8px; padding: 1rem; text-align: center;">'
+    '<h3 style="color: {color}; margin: 0;">{value}</h3>'
+    '<p style="color: {color}; margin: 0;">{label}</p>'
+    '</div>'
+)
+
+CONSTITUENCY_SECTION_HTML = {
+    'eci_candidates': """
+<div class="eci-table" style="margin-top: 2rem;">
+    <div class="eci-table-header">
+        CANDIDATE WISE RESULTS
+    </div>
+</div>
+""",
+    'candidates': """
+<div style="background: #F3E5F5; border: 2px solid #9C27B0; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
+    <h2 style="color: #6A1B9A; margin: 0;">👥 CANDIDATE vs CANDIDATE ANALYSIS</h2>
+    <p style="color: #7B1FA2; margin: 0.5rem 0 0 0;">Complete head-to-head comparison with winning chances</p>
+</div>
+""",
+    'comparison': """
+<div style="background: #ECEFF1; border: 2px solid #607D8B; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
+    <h3 style="color: #37474F; margin: 0;">📊 QUICK COMPARISON TABLE</h3>
+</div>
+""",
+    'eci_history': """
+<div class="eci-table" style="margin-top: 2rem;">
+    <div class="eci-table-header">
+        HISTORICAL RESULTS & DEMOGRAPHICS
+    </div>
+</div>
+""",
+    'history': """
+<div style="background: #FFF8E1; border: 2px solid #FFC107; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
+    <h2 style="color: #F57F17; margin: 0;">📊 HISTORICAL CONTEXT & DEMOGRAPHICS</h2>
+    <p style="color: #FF8F00; margin: 0.5rem 0 0 0;">Past election results and voter composition analysis</p>
+</div>
+""",
+    'previous_results': """
+<div style="background: #E8F5E8; border: 2px solid #4CAF50; border-radius: 8px; padding: 1.5rem;">
+    <h3 style="color: #2E7D32; margin: 0 0 1rem 0;">🏆 PREVIOUS ELECTION RESULTS</h3>
+</div>
+""",
+    'demographics': """
+<div style="background: #E3F2FD; border: 2px solid #2196F3; border-radius: 8px; padding: 1.5rem;">
+    <h3 style="color: #1565C0; margin: 0 0 1rem 0;">👥 VOTER DEMOGRAPHICS</h3>
+</div>
+""",
+}
+
+ECI_CANDIDATE_ROW_HTML = """
+<div class="eci-party-row">
+    <div>
+        <div class="eci-party-name">
+            {status_icon} {name}
+        </div>
+        <div style="font-size: 0.9rem; color: #666;">
+            {party_name} ({party_code}) • {alliance} Alliance
+        </div>
+        <div style="font-size: 0.8rem; color: #888; margin-top: 0.3rem;">
+            Age: {age} • Education: {education} • Assets: {assets}
+        </div>
+    </div>
+    <div style="display: flex; align-items: center; gap: 1rem;">
+        <div class="eci-percentage">{winning_chances:.1f}%</div>
+        <div class="{status_class}">{status_text}</div>
+    </div>
+</div>
+"""
+
+# Row/card styling by candidate rank: first, second, everyone else
+ECI_STATUS_STYLES = (
+    {'status_class': 'status-leading', 'status_text': 'LEADING', 'status_icon': '🥇'},
+    {'status_class': 'status-competitive', 'status_text': 'CHALLENGER', 'status_icon': '🥈'},
+    {'status_class': 'status-trailing', 'status_text': 'TRAILING', 'status_icon': '🥉'},
+)
+
+ECI_PREVIOUS_ELECTION_HTML = """
+<div class="eci-summary-box">
+    <h4 style="color: #1f4e79; margin: 0 0 0.5rem 0;">Previous Election (2020)</h4>
+    <strong>Winner:</strong> {last_winner}<br>
+    <strong>Party:</strong> {last_party}<br>
+    <strong>Margin:</strong> {last_margin:,} votes<br>
+    <strong>Trend:</strong> {trend}
+</div>
+"""
+
+ECI_DEMOGRAPHICS_HTML = """
+<div class="eci-summary-box">
+    <h4 style="color: #1f4e79; margin: 0 0 0.5rem 0;">Voter Demographics</h4>
+    <strong>Total Voters:</strong> {total_voters:,}<br>
+    <strong>Male:</strong> {male_voters:,} • <strong>Female:</strong> {female_voters:,}<br>
+    <strong>Urban:</strong> {urban_percentage:.1f}% • <strong>Literacy:</strong> {literacy_rate:.1f}%
+</div>
+"""
+
+ECI_NOTICE_HTML = """
+<div class="eci-party-row">
+    <div style="text-align: center; color: {color};">
+        <strong>{message}</strong>
+    </div>
+</div>
+"""
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _candidates_table(name: str) -> pd.DataFrame:
+    """Quick comparison table for one constituency's candidates, built column-wise"""
+    candidates = get_matchup(name)['candidates']
+    return pd.DataFrame({
+        'Status': ["🥇 Expected Winner" if i == 0 else f"🥈 Challenger #{i}"
+                   for i in range(len(candidates))],
+        'Candidate': [c['name'] for c in candidates],
+        'Party': [f"{c['party_name']} ({c['party_code']})" for c in candidates],
+        'Alliance': [c['alliance'] for c in candidates],
+        'Win Chance': [c['winning_chances'] for c in candidates],
+        'Age': [c['age'] for c in candidates],
+        'Education': [c['education'] for c in candidates],
+        'Assets': [c['assets'] for c in candidates],
+        'Criminal Cases': [c['criminal_cases'] for c in candidates],
+        'Experience': [c['experience'] for c in candidates]
+    })
+
+
 class ConstituencyDetailsComponent:
     """Shared component for constituency details across dashboard styles"""
     
@@ -16,15 +178,10 @@ class ConstituencyDetailsComponent:
     def render_constituency_selector(self, constituency_analyzer):
         """Render constituency selection interface"""
         try:
-            all_constituencies = list(constituency_analyzer.constituencies.keys())
-            all_constituencies.sort()
+            all_constituencies = constituency_names()
             
             if self.style == "eci":
-                st.markdown("""
-                <div style="background: #f8f9fa; border: 2px solid #1f4e79; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
-                    <h3 style="color: #1f4e79; margin: 0 0 1rem 0;">Select Constituency for Detailed Analysis</h3>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(SELECTOR_HEADER_HTML, unsafe_allow_html=True)
                 
                 selected_const = st.selectbox(
                     "Choose Constituency:",
@@ -59,201 +216,54 @@ class ConstituencyDetailsComponent:
         """Render constituency header based on style"""
         if self.style == "eci":
             # ECI official style header
-            st.markdown(f"""
-            <div class="eci-table">
-                <div class="eci-table-header">
-                    {selected_const.upper()} - CANDIDATE ANALYSIS
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # ECI-style metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                <div class="eci-summary-box">
-                    <strong>Constituency Code</strong><br>
-                    {matchup['constituency_code']}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(ECI_HEADER_HTML.format_map({'name': selected_const.upper()}), unsafe_allow_html=True)
             
-            with col2:
-                st.markdown(f"""
-                <div class="eci-summary-box">
-                    <strong>Region</strong><br>
-                    {matchup['region']}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div class="eci-summary-box">
-                    <strong>Total Candidates</strong><br>
-                    {matchup['total_candidates']}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown(f"""
-                <div class="eci-summary-box">
-                    <strong>Contest Type</strong><br>
-                    {matchup['battle_type']}
-                </div>
-                """, unsafe_allow_html=True)
+            # ECI-style metrics, one grid of summary boxes
+            boxes = "".join(
+                ECI_SUMMARY_BOX_HTML.format_map({'label': label, 'value': matchup[key]})
+                for key, label, _, _ in HEADER_METRICS
+            )
+            st.markdown(METRIC_GRID_HTML.format_map({'cards': boxes}), unsafe_allow_html=True)
         
         else:
             # Advanced style header
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #4CAF50 0%, #45A049 100%); 
-                        color: white; padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
-                <h2 style="margin: 0; text-align: center;">🏛️ {selected_const.upper()}</h2>
-                <p style="margin: 0.5rem 0 0 0; text-align: center; font-size: 1.1rem;">
-                    {matchup['region']} Region • {matchup['battle_type']} • {matchup['key_contest']}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Advanced style metrics
-            col1, col2, col3, col4 = st.columns(4)
+            st.markdown(ADVANCED_HEADER_HTML.format_map({**matchup, 'name': selected_const.upper()}), unsafe_allow_html=True)
             
-            metrics = [
-                (matchup['constituency_code'], "Constituency Code", "#4CAF50"),
-                (matchup['region'], "Region", "#FF9800"),
-                (matchup['total_candidates'], "Total Candidates", "#2196F3"),
-                (matchup['battle_type'], "Battle Type", "#E91E63")
-            ]
-            
-            for i, (value, label, color) in enumerate(metrics):
-                with [col1, col2, col3, col4][i]:
-                    st.markdown(f"""
-                    <div style="background: {color}20; border: 2px solid {color}; border-radius: 8px; padding: 1rem; text-align: center;">
-                        <h3 style="color: {color}; margin: 0;">{value}</h3>
-                        <p style="color: {color}; margin: 0;">{label}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            # Advanced style metrics, one grid of cards
+            cards = "".join(
+                METRIC_CARD_HTML.format_map({'value': matchup[key], 'label': label, 'color': color})
+                for key, _, label, color in HEADER_METRICS
+            )
+            st.markdown(METRIC_GRID_HTML.format_map({'cards': cards}), unsafe_allow_html=True)
     
     def render_candidates(self, matchup):
         """Render candidate information based on style"""
         if self.style == "eci":
             # ECI official table style
-            st.markdown("""
-            <div class="eci-table" style="margin-top: 2rem;">
-                <div class="eci-table-header">
-                    CANDIDATE WISE RESULTS
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(CONSTITUENCY_SECTION_HTML['eci_candidates'], unsafe_allow_html=True)
             
-            for i, candidate in enumerate(matchup['candidates']):
-                # Determine status styling
-                if i == 0:
-                    status_class = 'status-leading'
-                    status_text = 'LEADING'
-                    status_icon = '🥇'
-                elif i == 1:
-                    status_class = 'status-competitive'
-                    status_text = 'CHALLENGER'
-                    status_icon = '🥈'
-                else:
-                    status_class = 'status-trailing'
-                    status_text = 'TRAILING'
-                    status_icon = '🥉'
-                
-                st.markdown(f"""
-                <div class="eci-party-row">
-                    <div>
-                        <div class="eci-party-name">
-                            {status_icon} {candidate['name']}
-                        </div>
-                        <div style="font-size: 0.9rem; color: #666;">
-                            {candidate['party_name']} ({candidate['party_code']}) • {candidate['alliance']} Alliance
-                        </div>
-                        <div style="font-size: 0.8rem; color: #888; margin-top: 0.3rem;">
-                            Age: {candidate['age']} • Education: {candidate['education']} • Assets: {candidate['assets']}
-                        </div>
-                    </div>
-                    <div style="display: flex; align-items: center; gap: 1rem;">
-                        <div class="eci-percentage">{candidate['winning_chances']:.1f}%</div>
-                        <div class="{status_class}">{status_text}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # One markdown element for all candidate rows
+            rows_html = "\n".join(
+                ECI_CANDIDATE_ROW_HTML.format_map({**candidate, **ECI_STATUS_STYLES[min(i, 2)]})
+                for i, candidate in enumerate(matchup['candidates'])
+            )
+            st.markdown(rows_html, unsafe_allow_html=True)
         
         else:
             # Advanced style with enhanced cards
-            st.markdown("""
-            <div style="background: #F3E5F5; border: 2px solid #9C27B0; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
-                <h2 style="color: #6A1B9A; margin: 0;">👥 CANDIDATE vs CANDIDATE ANALYSIS</h2>
-                <p style="color: #7B1FA2; margin: 0.5rem 0 0 0;">Complete head-to-head comparison with winning chances</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(CONSTITUENCY_SECTION_HTML['candidates'], unsafe_allow_html=True)
             
-            # Enhanced candidate cards
-            for i, candidate in enumerate(matchup['candidates']):
-                # Determine card styling based on position
-                if i == 0:
-                    card_color = "#4CAF50"
-                    bg_color = "#E8F5E8"
-                    status_icon = "🥇"
-                    status_text = "EXPECTED WINNER"
-                elif i == 1:
-                    card_color = "#FF9800"
-                    bg_color = "#FFF3E0"
-                    status_icon = "🥈"
-                    status_text = "MAIN CHALLENGER"
-                else:
-                    card_color = "#9E9E9E"
-                    bg_color = "#F5F5F5"
-                    status_icon = "🥉"
-                    status_text = f"CHALLENGER #{i}"
-                
-                st.markdown(f"""
-                <div style="background: {bg_color}; border: 3px solid {card_color}; border-radius: 10px; padding: 1.5rem; margin: 1rem 0;">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                        <h3 style="color: {card_color}; margin: 0;">{status_icon} {candidate['name']}</h3>
-                        <span style="background: {card_color}; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-weight: bold;">
-                            {status_text}
-                        </span>
-                    </div>
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;">
-                        <div><strong>Party:</strong> {candidate['party_name']} ({candidate['party_code']})</div>
-                        <div><strong>Alliance:</strong> {candidate['alliance']}</div>
-                        <div><strong>Win Chance:</strong> <span style="color: {card_color}; font-weight: bold;">{candidate['winning_chances']:.1f}%</span></div>
-                        <div><strong>Age:</strong> {candidate['age']} years</div>
-                        <div><strong>Education:</strong> {candidate['education']}</div>
-                        <div><strong>Assets:</strong> {candidate['assets']}</div>
-                        <div><strong>Criminal Cases:</strong> {candidate['criminal_cases']}</div>
-                        <div><strong>Experience:</strong> {candidate['experience']}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Enhanced candidate cards, emitted as one markdown element
+            cards_html = "\n".join(
+                CANDIDATE_CARD_HTML.format_map({**candidate, **rank_style(i)})
+                for i, candidate in enumerate(matchup['candidates'])
+            )
+            st.markdown(cards_html, unsafe_allow_html=True)
             
             # Also show comparison table
-            st.markdown("""
-            <div style="background: #ECEFF1; border: 2px solid #607D8B; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
-                <h3 style="color: #37474F; margin: 0;">📊 QUICK COMPARISON TABLE</h3>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            candidates_data = []
-            for i, candidate in enumerate(matchup['candidates']):
-                status = "🥇 Expected Winner" if i == 0 else f"🥈 Challenger #{i}"
-                
-                candidates_data.append({
-                    'Status': status,
-                    'Candidate': candidate['name'],
-                    'Party': f"{candidate['party_name']} ({candidate['party_code']})",
-                    'Alliance': candidate['alliance'],
-                    'Win Chance': f"{candidate['winning_chances']:.1f}%",
-                    'Age': candidate['age'],
-                    'Education': candidate['education'],
-                    'Assets': candidate['assets'],
-                    'Criminal Cases': candidate['criminal_cases'],
-                    'Experience': candidate['experience']
-                })
+            st.markdown(CONSTITUENCY_SECTION_HTML['comparison'], unsafe_allow_html=True)
             
-            candidates_df = pd.DataFrame(candidates_data)
+            candidates_df = _candidates_table(matchup['constituency'])
             st.dataframe(
                 candidates_df, 
                 hide_index=True, 
@@ -276,54 +286,24 @@ class ConstituencyDetailsComponent:
         
         if self.style == "eci":
             # ECI official style
-            st.markdown("""
-            <div class="eci-table" style="margin-top: 2rem;">
-                <div class="eci-table-header">
-                    HISTORICAL RESULTS & DEMOGRAPHICS
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(CONSTITUENCY_SECTION_HTML['eci_history'], unsafe_allow_html=True)
             
             col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown(f"""
-                <div class="eci-summary-box">
-                    <h4 style="color: #1f4e79; margin: 0 0 0.5rem 0;">Previous Election (2020)</h4>
-                    <strong>Winner:</strong> {hist_context['last_winner']}<br>
-                    <strong>Party:</strong> {hist_context['last_party']}<br>
-                    <strong>Margin:</strong> {hist_context['last_margin']:,} votes<br>
-                    <strong>Trend:</strong> {hist_context['trend']}
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(ECI_PREVIOUS_ELECTION_HTML.format_map(hist_context), unsafe_allow_html=True)
             
             with col2:
-                st.markdown(f"""
-                <div class="eci-summary-box">
-                    <h4 style="color: #1f4e79; margin: 0 0 0.5rem 0;">Voter Demographics</h4>
-                    <strong>Total Voters:</strong> {demographics['total_voters']:,}<br>
-                    <strong>Male:</strong> {demographics['male_voters']:,} • <strong>Female:</strong> {demographics['female_voters']:,}<br>
-                    <strong>Urban:</strong> {demographics['urban_percentage']:.1f}% • <strong>Literacy:</strong> {demographics['literacy_rate']:.1f}%
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(ECI_DEMOGRAPHICS_HTML.format_map(demographics), unsafe_allow_html=True)
         
         else:
             # Advanced style
-            st.markdown("""
-            <div style="background: #FFF8E1; border: 2px solid #FFC107; border-radius: 8px; padding: 1rem; margin: 2rem 0 1rem 0;">
-                <h2 style="color: #F57F17; margin: 0;">📊 HISTORICAL CONTEXT & DEMOGRAPHICS</h2>
-                <p style="color: #FF8F00; margin: 0.5rem 0 0 0;">Past election results and voter composition analysis</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(CONSTITUENCY_SECTION_HTML['history'], unsafe_allow_html=True)
             
             col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown("""
-                <div style="background: #E8F5E8; border: 2px solid #4CAF50; border-radius: 8px; padding: 1.5rem;">
-                    <h3 style="color: #2E7D32; margin: 0 0 1rem 0;">🏆 PREVIOUS ELECTION RESULTS</h3>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CONSTITUENCY_SECTION_HTML['previous_results'], unsafe_allow_html=True)
                 
                 st.metric("2020 Winner", f"{hist_context['last_winner']}")
                 st.metric("Winning Party", f"{hist_context['last_party']}")
@@ -331,20 +311,12 @@ class ConstituencyDetailsComponent:
                 
                 # Trend indicator
                 trend_color = "#4CAF50" if "Stable" in hist_context['trend'] else "#FF9800"
-                st.markdown(f"""
-                <div style="background: {trend_color}; color: white; padding: 0.5rem; border-radius: 5px; text-align: center; margin: 1rem 0;">
-                    <strong>Trend: {hist_context['trend']}</strong>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(TREND_BADGE_HTML.format_map({'trend_color': trend_color, 'trend': hist_context['trend']}), unsafe_allow_html=True)
                 
                 st.markdown(f"**🎯 Swing Potential:** {hist_context['swing_potential']}")
             
             with col2:
-                st.markdown("""
-                <div style="background: #E3F2FD; border: 2px solid #2196F3; border-radius: 8px; padding: 1.5rem;">
-                    <h3 style="color: #1565C0; margin: 0 0 1rem 0;">👥 VOTER DEMOGRAPHICS</h3>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CONSTITUENCY_SECTION_HTML['demographics'], unsafe_allow_html=True)
                 
                 st.metric("Total Voters", f"{demographics['total_voters']:,}")
                 
@@ -364,43 +336,35 @@ class ConstituencyDetailsComponent:
     
     def render_complete_analysis(self, const_prob_df):
         """Render complete constituency details analysis"""
-        # Import candidate data
-        try:
-            from src.data.constituency_candidates import constituency_analyzer
-        except ImportError:
+        # Candidate data, imported once per process
+        constituency_analyzer = get_analyzer()
+        if constituency_analyzer is None:
             if self.style == "eci":
-                st.markdown("""
-                <div class="eci-party-row">
-                    <div style="text-align: center; color: #dc3545;">
-                        <strong>Candidate data not available</strong>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(ECI_NOTICE_HTML.format_map({'color': '#dc3545', 'message': 'Candidate data not available'}), unsafe_allow_html=True)
             else:
                 st.error("Candidate data not available")
             return
         
         if const_prob_df.empty:
             if self.style == "eci":
-                st.markdown("""
-                <div class="eci-party-row">
-                    <div style="text-align: center; color: #ffc107;">
-                        <strong>No constituency data available</strong>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(ECI_NOTICE_HTML.format_map({'color': '#ffc107', 'message': 'No constituency data available'}), unsafe_allow_html=True)
             else:
                 st.warning("No constituency data available")
             return
         
-        # Render constituency selector
+        # Selector and details form one fragment, so changing the selection
+        # reruns only this subtree instead of the whole dashboard
+        st.fragment(self.render_selected_constituency)(constituency_analyzer)
+    
+    def render_selected_constituency(self, constituency_analyzer):
+        """Render the constituency selector and the analysis for the current selection"""
         selected_const = self.render_constituency_selector(constituency_analyzer)
         
         if selected_const:
-            matchup = constituency_analyzer.get_candidate_matchup(selected_const)
+            matchup = get_matchup(selected_const)
             
             if matchup:
                 # Render all components
                 self.render_constituency_header(selected_const, matchup)
                 self.render_candidates(matchup)
-                self.render_historical_context(matchup)
\ No newline at end of file
+                self.render_historical_context(matchup)
@@ -1,11 +1,9 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
 import sys
 import os
 
@@ -15,6 +13,20 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # Now import from src
 from src.config.settings import Config
+from src.utils.fast_json import read_json
+
+# Party data, with a minimal fallback if the party module is unavailable
+try:
+    from src.data.bihar_parties import BIHAR_PARTIES, NDA_PARTIES, INDI_PARTIES
+except ImportError:
+    BIHAR_PARTIES = {
+        'BJP': {'full_name': 'Bharatiya Janata Party', 'color': '#FF9933'},
+        'JDU': {'full_name': 'Janata Dal (United)', 'color': '#006400'},
+        'RJD': {'full_name': 'Rashtriya Janata Dal', 'color': '#008000'},
+        'INC': {'full_name': 'Indian National Congress', 'color': '#19AAED'}
+    }
+    NDA_PARTIES = ['BJP', 'JDU']
+    INDI_PARTIES = ['RJD', 'INC']
 
 # Page configuration - Professional Forecast Style
 st.set_page_config(
@@ -24,6 +36,407 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Dashboard-wide styles, re-sent on every run since Streamlit drops elements a rerun does not emit
+PROFESSIONAL_CSS = """
+<style>
+/* ECI Header Styling */
+.eci-header {
+    background: linear-gradient(135deg, #1f4e79 0%, #2e5984 100%);
+    color: white;
+    padding: 1.5rem 2rem;
+    margin: -1rem -1rem 2rem -1rem;
+    border-bottom: 4px solid #ff6b35;
+}
+
+.eci-title {
+    font-size: 2.2rem;
+    font-weight: bold;
+    margin: 0;
+    text-align: center;
+}
+
+.eci-subtitle {
+    font-size: 1.1rem;
+    text-align: center;
+    margin: 0.5rem 0 0 0;
+    opacity: 0.9;
+}
+
+.eci-logo {
+    text-align: center;
+    font-size: 3rem;
+    margin-bottom: 1rem;
+}
+
+/* ECI Table Styling */
+.eci-table {
+    border: 2px solid #1f4e79;
+    border-radius: 8px;
+    overflow: hidden;
+    margin: 1rem 0;
+}
+
+.eci-table-header {
+    background: #1f4e79;
+    color: white;
+    padding: 1rem;
+    font-weight: bold;
+    text-align: center;
+    font-size: 1.2rem;
+}
+
+.eci-summary-box {
+    background: white;
+    border: 2px solid #1f4e79;
+    border-radius: 8px;
+    padding: 1.5rem;
+    margin: 1rem 0;
+    text-align: center;
+    color: #1f4e79;
+    font-weight: bold;
+}
+
+.eci-party-row {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    padding: 0.8rem 1rem;
+    border-bottom: 1px solid #dee2e6;
+    background: white;
+    color: #333;
+}
+
+.eci-party-row:hover {
+    background: #f8f9fa;
+}
+
+.eci-party-name {
+    font-weight: bold;
+    font-size: 1.1rem;
+    color: #1f4e79;
+}
+
+.eci-seats {
+    font-size: 1.3rem;
+    font-weight: bold;
+    color: #1f4e79;
+}
+
+.eci-percentage {
+    font-size: 1rem;
+    color: #333;
+    font-weight: 500;
+}
+
+/* Status indicators */
+.status-leading {
+    background: #28a745;
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 20px;
+    font-size: 0.9rem;
+    font-weight: bold;
+}
+
+.status-trailing {
+    background: #dc3545;
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 20px;
+    font-size: 0.9rem;
+    font-weight: bold;
+}
+
+.status-competitive {
+    background: #ffc107;
+    color: #000;
+    padding: 0.3rem 0.8rem;
+    border-radius: 20px;
+    font-size: 0.9rem;
+    font-weight: bold;
+}
+
+/* ECI Footer */
+.eci-footer {
+    background: #1f4e79;
+    color: white;
+    padding: 1rem;
+    text-align: center;
+    margin: 2rem -1rem -1rem -1rem;
+    font-size: 0.9rem;
+}
+
+/* Metrics styling */
+.eci-metric {
+    background: white;
+    border: 3px solid #1f4e79;
+    border-radius: 8px;
+    padding: 1.5rem;
+    text-align: center;
+    margin: 0.5rem 0;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.eci-metric-value {
+    font-size: 2.5rem;
+    font-weight: bold;
+    color: #1f4e79;
+    margin: 0;
+    text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
+}
+
+.eci-metric-label {
+    font-size: 1.1rem;
+    color: #333;
+    margin: 0.5rem 0 0 0;
+    font-weight: 600;
+}
+
+/* Hide Streamlit elements */
+.stDeployButton {display:none;}
+footer {visibility: hidden;}
+.stApp > header {visibility: hidden;}
+
+/* Custom scrollbar */
+::-webkit-scrollbar {
+    width: 8px;
+}
+::-webkit-scrollbar-track {
+    background: #f1f1f1;
+}
+::-webkit-scrollbar-thumb {
+    background: #1f4e79;
+    border-radius: 4px;
+}
+</style>
+"""
+
+
+# Sample forecast updates, static, so their rows are formatted once at import
+LIVE_UPDATES = [
+    {
+        'time': '14:30',
+        'update': 'Monte Carlo simulation updated with latest poll data - NDA projected 125 seats'
+    },
+    {
+        'time': '14:15', 
+        'update': 'Model identifies 35 highly competitive constituencies with <55% win probability'
+    },
+    {
+        'time': '14:00',
+        'update': 'Sentiment analysis shows INDI alliance gaining momentum in Seemanchal region'
+    },
+    {
+        'time': '13:45',
+        'update': 'Feature engineering complete: BJP forecast 69 seats, RJD 68 seats'
+    },
+    {
+        'time': '13:30',
+        'update': 'News sentiment data integrated into forecasting model'
+    }
+]
+
+LIVE_UPDATE_ROW_HTML = """
+<div class="eci-party-row">
+    <div>
+        <div style="font-weight: bold; color: #1f4e79;">{time}</div>
+    </div>
+    <div style="flex: 1; padding-left: 1rem;">
+        {update}
+    </div>
+</div>
+"""
+LIVE_UPDATES_HTML = "\n".join(LIVE_UPDATE_ROW_HTML.format_map(update) for update in LIVE_UPDATES)
+
+
+# Forecast files read from the latest date directory
+RESULT_FILES = ("forecast_summary.json", "marginal_seats.csv", "constituency_probabilities.csv")
+
+
+def _results_mtime(latest_dir: Path) -> float:
+    """Newest mtime of the result files in latest_dir; the pipeline overwrites them in place, which leaves the directory mtime unchanged"""
+    mtimes = []
+    for name in RESULT_FILES:
+        try:
+            mtimes.append((latest_dir / name).stat().st_mtime)
+        except FileNotFoundError:
+            continue
+    return max(mtimes, default=0.0)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_results(latest_dir: str, mtime: float):
+    """Load one date directory's forecast files; mtime (newest result file) is part of the cache key so a rerun forecast is read again"""
+    latest_dir = Path(latest_dir)
+    
+    # Load forecast summary
+    summary_path = latest_dir / "forecast_summary.json"
+    summary = {}
+    if summary_path.exists():
+        summary = read_json(summary_path)
+    
+    # Load marginal seats
+    marginal_path = latest_dir / "marginal_seats.csv"
+    marginal_df = pd.DataFrame()
+    if marginal_path.exists():
+        marginal_df = pd.read_csv(marginal_path, engine='pyarrow', dtype_backend='pyarrow')
+    
+    # Load constituency probabilities
+    const_prob_path = latest_dir / "constituency_probabilities.csv"
+    const_prob_df = pd.DataFrame()
+    if const_prob_path.exists():
+        const_prob_df = pd.read_csv(const_prob_path, engine='pyarrow', dtype_backend='pyarrow')
+    
+    return summary, marginal_df, const_prob_df
+
+
+@st.cache_resource(show_spinner=False)
+def _seat_pie_template() -> dict:
+    """Projected seat distribution donut chart as a figure dict with placeholder values, built once per process"""
+    labels = ['NDA', 'INDI', 'Others']
+    colors = ['#FF9933', '#19AAED', '#808080']
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=labels, 
+        values=[0, 0, 0], 
+        marker_colors=colors,
+        hole=0.4,
+        textinfo='label+percent+value',
+        textfont_size=16,
+        textfont_color='white',
+        textposition='auto',
+        marker=dict(
+            colors=colors,
+            line=dict(color='white', width=3)
+        )
+    )])
+    
+    fig.update_layout(
+        title={
+            'text': "Projected Seat Distribution",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18, 'color': '#1f4e79'}
+        },
+        height=400,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5
+        ),
+        font=dict(size=12)
+    )
+    
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def _build_seat_pie(nda_seats: int, indi_seats: int, others_seats: int) -> dict:
+    """Projected seat distribution donut chart for the given seat counts as a plain figure dict"""
+    template = _seat_pie_template()
+    pie = {**template['data'][0], 'values': [nda_seats, indi_seats, others_seats]}
+    return {'data': [pie], 'layout': template['layout']}
+
+
+@st.cache_data(show_spinner=False)
+def _build_party_html(nda_seats: int, indi_seats: int, others_seats: int) -> tuple:
+    """Alliance rows and individual party rows for the party-wise forecast as two HTML strings"""
+    # Alliance-wise results
+    alliances = [
+        {
+            'name': 'NDA (National Democratic Alliance)',
+            'seats': nda_seats,
+            'parties': NDA_PARTIES,
+            'status': 'leading' if nda_seats >= 122 else 'trailing',
+            'color': '#FF9933'
+        },
+        {
+            'name': 'INDI (Indian National Developmental Inclusive Alliance)',
+            'seats': indi_seats,
+            'parties': INDI_PARTIES,
+            'status': 'leading' if indi_seats >= 122 else 'trailing',
+            'color': '#19AAED'
+        },
+        {
+            'name': 'Others',
+            'seats': others_seats,
+            'parties': [],
+            'status': 'others',
+            'color': '#808080'
+        }
+    ]
+    
+    # Render alliance results as one markdown element
+    # Seat shares for every row in one vectorized divide
+    alliance_pcts = np.array([alliance['seats'] for alliance in alliances], dtype=np.float64) * (100 / 243)
+    
+    alliance_rows = []
+    for alliance, percentage in zip(alliances, alliance_pcts):
+        status_class = f"status-{alliance['status']}"
+        if alliance['status'] == 'others':
+            status_class = "status-competitive"
+        
+        alliance_rows.append(f"""
+        <div class="eci-party-row">
+            <div>
+                <div class="eci-party-name" style="color: {alliance['color']}">
+                    {alliance['name']}
+                </div>
+            </div>
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <div class="eci-percentage">{percentage:.1f}%</div>
+                <div class="eci-seats">{alliance['seats']}</div>
+                <div class="{status_class}">
+                    {alliance['status'].upper() if alliance['status'] != 'others' else 'OTHERS'}
+                </div>
+            </div>
+        </div>
+        """)
+    
+    # Dynamic individual party seat projections based on actual forecast
+    party_results = [
+        {'name': 'Bharatiya Janata Party', 'code': 'BJP', 'seats': int(nda_seats * 0.51), 'alliance': 'NDA', 'color': '#FF9933'},
+        {'name': 'Janata Dal (United)', 'code': 'JDU', 'seats': int(nda_seats * 0.41), 'alliance': 'NDA', 'color': '#006400'},
+        {'name': 'Hindustani Awam Morcha', 'code': 'HAM', 'seats': int(nda_seats * 0.05), 'alliance': 'NDA', 'color': '#800080'},
+        {'name': 'Vikassheel Insaan Party', 'code': 'VIP', 'seats': int(nda_seats * 0.03), 'alliance': 'NDA', 'color': '#FFD700'},
+        {'name': 'Rashtriya Janata Dal', 'code': 'RJD', 'seats': int(indi_seats * 0.82), 'alliance': 'INDI', 'color': '#008000'},
+        {'name': 'Indian National Congress', 'code': 'INC', 'seats': int(indi_seats * 0.13), 'alliance': 'INDI', 'color': '#19AAED'},
+        {'name': 'Communist Party of India (ML)', 'code': 'CPI_ML', 'seats': int(indi_seats * 0.05), 'alliance': 'INDI', 'color': '#FF0000'},
+        {'name': 'Jan Suraaj Party', 'code': 'JSP', 'seats': 12, 'alliance': 'Others', 'color': '#FF6B35'},
+        {'name': 'All India Majlis-e-Ittehadul Muslimeen', 'code': 'AIMIM', 'seats': 4, 'alliance': 'Others', 'color': '#00FF00'},
+        {'name': 'Lok Janshakti Party (Secular)', 'code': 'LJSP', 'seats': 3, 'alliance': 'Others', 'color': '#4169E1'},
+        {'name': 'Bahujan Samaj Party', 'code': 'BSP', 'seats': 2, 'alliance': 'Others', 'color': '#0000FF'},
+        {'name': 'Others/Independents', 'code': 'OTH', 'seats': 8, 'alliance': 'Others', 'color': '#808080'}
+    ]
+    
+    party_results = [party for party in party_results if party['seats'] > 0]
+    party_pcts = np.array([party['seats'] for party in party_results], dtype=np.float64) * (100 / 243)
+    
+    party_rows = []
+    for party, percentage in zip(party_results, party_pcts):
+        party_rows.append(f"""
+        <div class="eci-party-row">
+            <div>
+                <div class="eci-party-name" style="color: {party['color']}">
+                    {party['name']} ({party['code']})
+                </div>
+                <div style="font-size: 0.9rem; color: #666;">
+                    {party['alliance']} Alliance
+                </div>
+            </div>
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <div class="eci-percentage">{percentage:.1f}%</div>
+                <div class="eci-seats">{party['seats']}</div>
+            </div>
+        </div>
+        """)
+    
+    return "\n".join(alliance_rows), "\n".join(party_rows)
+
+
 class OfficialStyleDashboard:
     """Professional forecast dashboard with government-style interface for statistical modeling"""
     
@@ -48,209 +461,22 @@ class OfficialStyleDashboard:
     
     def _inject_professional_css(self):
         """Inject professional forecast system CSS"""
-        st.markdown("""
-        <style>
-        /* ECI Header Styling */
-        .eci-header {
-            background: linear-gradient(135deg, #1f4e79 0%, #2e5984 100%);
-            color: white;
-            padding: 1.5rem 2rem;
-            margin: -1rem -1rem 2rem -1rem;
-            border-bottom: 4px solid #ff6b35;
-        }
-        
-        .eci-title {
-            font-size: 2.2rem;
-            font-weight: bold;
-            margin: 0;
-            text-align: center;
-        }
-        
-        .eci-subtitle {
-            font-size: 1.1rem;
-            text-align: center;
-            margin: 0.5rem 0 0 0;
-            opacity: 0.9;
-        }
-        
-        .eci-logo {
-            text-align: center;
-            font-size: 3rem;
-            margin-bottom: 1rem;
-        }
-        
-        /* ECI Table Styling */
-        .eci-table {
-            border: 2px solid #1f4e79;
-            border-radius: 8px;
-            overflow: hidden;
-            margin: 1rem 0;
-        }
-        
-        .eci-table-header {
-            background: #1f4e79;
-            color: white;
-            padding: 1rem;
-            font-weight: bold;
-            text-align: center;
-            font-size: 1.2rem;
-        }
-        
-        .eci-summary-box {
-            background: white;
-            border: 2px solid #1f4e79;
-            border-radius: 8px;
-            padding: 1.5rem;
-            margin: 1rem 0;
-            text-align: center;
-            color: #1f4e79;
-            font-weight: bold;
-        }
-        
-        .eci-party-row {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 0.8rem 1rem;
-            border-bottom: 1px solid #dee2e6;
-            background: white;
-            color: #333;
-        }
-        
-        .eci-party-row:hover {
-            background: #f8f9fa;
-        }
-        
-        .eci-party-name {
-            font-weight: bold;
-            font-size: 1.1rem;
-            color: #1f4e79;
-        }
-        
-        .eci-seats {
-            font-size: 1.3rem;
-            font-weight: bold;
-            color: #1f4e79;
-        }
-        
-        .eci-percentage {
-            font-size: 1rem;
-            color: #333;
-            font-weight: 500;
-        }
-        
-        /* Status indicators */
-        .status-leading {
-            background: #28a745;
-            color: white;
-            padding: 0.3rem 0.8rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: bold;
-        }
-        
-        .status-trailing {
-            background: #dc3545;
-            color: white;
-            padding: 0.3rem 0.8rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: bold;
-        }
-        
-        .status-competitive {
-            background: #ffc107;
-            color: #000;
-            padding: 0.3rem 0.8rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: bold;
-        }
-        
-        /* ECI Footer */
-        .eci-footer {
-            background: #1f4e79;
-            color: white;
-            padding: 1rem;
-            text-align: center;
-            margin: 2rem -1rem -1rem -1rem;
-            font-size: 0.9rem;
-        }
-        
-        /* Metrics styling */
-        .eci-metric {
-            background: white;
-            border: 3px solid #1f4e79;
-            border-radius: 8px;
-            padding: 1.5rem;
-            text-align: center;
-            margin: 0.5rem 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        
-        .eci-metric-value {
-            font-size: 2.5rem;
-            font-weight: bold;
-            color: #1f4e79;
-            margin: 0;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-        }
-        
-        .eci-metric-label {
-            font-size: 1.1rem;
-            color: #333;
-            margin: 0.5rem 0 0 0;
-            font-weight: 600;
-        }
-        
-        /* Hide Streamlit elements */
-        .stDeployButton {display:none;}
-        footer {visibility: hidden;}
-        .stApp > header {visibility: hidden;}
-        
-        /* Custom scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-        }
-        ::-webkit-scrollbar-track {
-            background: #f1f1f1;
-        }
-        ::-webkit-scrollbar-thumb {
-            background: #1f4e79;
-            border-radius: 4px;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(PROFESSIONAL_CSS, unsafe_allow_html=True)
     
     def load_latest_results(self):
         """Load most recent forecast results"""
         try:
-            # Get most recent date directory
-            date_dirs = sorted([d for d in self.results_dir.iterdir() if d.is_dir()], reverse=True)
+            # Get most recent date directory in one scandir pass
+            with os.scandir(self.results_dir) as entries:
+                latest_name = max((e.name for e in entries if e.is_dir()), default=None)
             
-            if not date_dirs:
+            if latest_name is None:
                 return {}, pd.DataFrame(), pd.DataFrame(), None
             
-            latest_dir = date_dirs[0]
+            latest_dir = self.results_dir / latest_name
             
-            # Load forecast summary
-            summary_path = latest_dir / "forecast_summary.json"
-            summary = {}
-            if summary_path.exists():
-                with open(summary_path) as f:
-                    summary = json.load(f)
-            
-            # Load marginal seats
-            marginal_path = latest_dir / "marginal_seats.csv"
-            marginal_df = pd.DataFrame()
-            if marginal_path.exists():
-                marginal_df = pd.read_csv(marginal_path)
-            
-            # Load constituency probabilities
-            const_prob_path = latest_dir / "constituency_probabilities.csv"
-            const_prob_df = pd.DataFrame()
-            if const_prob_path.exists():
-                const_prob_df = pd.read_csv(const_prob_path)
+            # Parsed files are cached until one of them is rewritten
+            summary, marginal_df, const_prob_df = _load_results(str(latest_dir), _results_mtime(latest_dir))
             
             return summary, marginal_df, const_prob_df, latest_dir
             
@@ -414,69 +640,8 @@ class OfficialStyleDashboard:
         </div>
         """, unsafe_allow_html=True)
         
-        # Import party data
-        try:
-            from src.data.bihar_parties import BIHAR_PARTIES, NDA_PARTIES, INDI_PARTIES
-        except ImportError:
-            # Fallback party data
-            BIHAR_PARTIES = {
-                'BJP': {'full_name': 'Bharatiya Janata Party', 'color': '#FF9933'},
-                'JDU': {'full_name': 'Janata Dal (United)', 'color': '#006400'},
-                'RJD': {'full_name': 'Rashtriya Janata Dal', 'color': '#008000'},
-                'INC': {'full_name': 'Indian National Congress', 'color': '#19AAED'}
-            }
-            NDA_PARTIES = ['BJP', 'JDU']
-            INDI_PARTIES = ['RJD', 'INC']
-        
-        # Alliance-wise results
-        alliances = [
-            {
-                'name': 'NDA (National Democratic Alliance)',
-                'seats': nda_seats,
-                'parties': NDA_PARTIES,
-                'status': 'leading' if nda_seats >= 122 else 'trailing',
-                'color': '#FF9933'
-            },
-            {
-                'name': 'INDI (Indian National Developmental Inclusive Alliance)',
-                'seats': indi_seats,
-                'parties': INDI_PARTIES,
-                'status': 'leading' if indi_seats >= 122 else 'trailing',
-                'color': '#19AAED'
-            },
-            {
-                'name': 'Others',
-                'seats': others_seats,
-                'parties': [],
-                'status': 'others',
-                'color': '#808080'
-            }
-        ]
-        
-        # Render alliance results
-        for alliance in alliances:
-            status_class = f"status-{alliance['status']}"
-            if alliance['status'] == 'others':
-                status_class = "status-competitive"
-            
-            percentage = (alliance['seats'] / 243) * 100
-            
-            st.markdown(f"""
-            <div class="eci-party-row">
-                <div>
-                    <div class="eci-party-name" style="color: {alliance['color']}">
-                        {alliance['name']}
-                    </div>
-                </div>
-                <div style="display: flex; align-items: center; gap: 1rem;">
-                    <div class="eci-percentage">{percentage:.1f}%</div>
-                    <div class="eci-seats">{alliance['seats']}</div>
-                    <div class="{status_class}">
-                        {alliance['status'].upper() if alliance['status'] != 'others' else 'OTHERS'}
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        alliance_html, party_html = _build_party_html(nda_seats, indi_seats, others_seats)
+        st.markdown(alliance_html, unsafe_allow_html=True)
         
         # Individual party breakdown
         st.markdown("""
@@ -487,42 +652,7 @@ class OfficialStyleDashboard:
         </div>
         """, unsafe_allow_html=True)
         
-        # Dynamic individual party seat projections based on actual forecast
-        party_results = [
-            {'name': 'Bharatiya Janata Party', 'code': 'BJP', 'seats': int(nda_seats * 0.51), 'alliance': 'NDA', 'color': '#FF9933'},
-            {'name': 'Janata Dal (United)', 'code': 'JDU', 'seats': int(nda_seats * 0.41), 'alliance': 'NDA', 'color': '#006400'},
-            {'name': 'Hindustani Awam Morcha', 'code': 'HAM', 'seats': int(nda_seats * 0.05), 'alliance': 'NDA', 'color': '#800080'},
-            {'name': 'Vikassheel Insaan Party', 'code': 'VIP', 'seats': int(nda_seats * 0.03), 'alliance': 'NDA', 'color': '#FFD700'},
-            {'name': 'Rashtriya Janata Dal', 'code': 'RJD', 'seats': int(indi_seats * 0.82), 'alliance': 'INDI', 'color': '#008000'},
-            {'name': 'Indian National Congress', 'code': 'INC', 'seats': int(indi_seats * 0.13), 'alliance': 'INDI', 'color': '#19AAED'},
-            {'name': 'Communist Party of India (ML)', 'code': 'CPI_ML', 'seats': int(indi_seats * 0.05), 'alliance': 'INDI', 'color': '#FF0000'},
-            {'name': 'Jan Suraaj Party', 'code': 'JSP', 'seats': 12, 'alliance': 'Others', 'color': '#FF6B35'},
-            {'name': 'All India Majlis-e-Ittehadul Muslimeen', 'code': 'AIMIM', 'seats': 4, 'alliance': 'Others', 'color': '#00FF00'},
-            {'name': 'Lok Janshakti Party (Secular)', 'code': 'LJSP', 'seats': 3, 'alliance': 'Others', 'color': '#4169E1'},
-            {'name': 'Bahujan Samaj Party', 'code': 'BSP', 'seats': 2, 'alliance': 'Others', 'color': '#0000FF'},
-            {'name': 'Others/Independents', 'code': 'OTH', 'seats': 8, 'alliance': 'Others', 'color': '#808080'}
-        ]
-        
-        for party in party_results:
-            if party['seats'] > 0:
-                percentage = (party['seats'] / 243) * 100
-                
-                st.markdown(f"""
-                <div class="eci-party-row">
-                    <div>
-                        <div class="eci-party-name" style="color: {party['color']}">
-                            {party['name']} ({party['code']})
-                        </div>
-                        <div style="font-size: 0.9rem; color: #666;">
-                            {party['alliance']} Alliance
-                        </div>
-                    </div>
-                    <div style="display: flex; align-items: center; gap: 1rem;">
-                        <div class="eci-percentage">{percentage:.1f}%</div>
-                        <div class="eci-seats">{party['seats']}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+        st.markdown(party_html, unsafe_allow_html=True)
     
     def render_constituency_summary(self, const_prob_df):
         """Render constituency-wise summary"""
@@ -550,37 +680,30 @@ class OfficialStyleDashboard:
             ]
             
             const_df = pd.DataFrame(constituencies)
+            names = const_df['name'].to_numpy()
+            regions = const_df['region'].to_numpy()
+            probs = const_df['nda_prob'].to_numpy()
+            statuses = const_df['status'].to_numpy()
         else:
-            const_df = const_prob_df.head(10).copy()
-            const_df['status'] = const_df['nda_win_probability'].apply(
-                lambda x: 'NDA Leading' if x > 0.6 else 'INDI Leading' if x < 0.4 else 'Close Contest'
-            )
+            const_df = const_prob_df.head(10)
+            names = const_df['constituency'].to_numpy()
+            regions = const_df['region'].to_numpy() if 'region' in const_df.columns else np.full(len(const_df), 'Unknown')
+            probs = const_df['nda_win_probability'].to_numpy(dtype=np.float64)
+            statuses = np.select([probs > 0.6, probs < 0.4], ['NDA Leading', 'INDI Leading'], default='Close Contest')
+        
+        # Status styling by label
+        status_classes = {
+            'NDA Leading': 'status-leading',
+            'INDI Leading': 'status-trailing',
+            'Close Contest': 'status-competitive'
+        }
         
-        # Display top constituencies
-        for _, row in const_df.iterrows():
-            if 'nda_prob' in row:
-                prob = row['nda_prob']
-                name = row['name']
-                region = row['region']
-            else:
-                prob = row.get('nda_win_probability', 0.5)
-                name = row.get('constituency', 'Unknown')
-                region = row.get('region', 'Unknown')
-            
-            status = row['status']
+        # Display top constituencies as one markdown element
+        constituency_rows = []
+        for name, region, prob, status in zip(names, regions, probs, statuses):
+            status_class = status_classes[status]
             
-            # Determine status styling
-            if 'NDA' in status:
-                status_class = 'status-leading'
-                status_color = '#28a745'
-            elif 'INDI' in status:
-                status_class = 'status-trailing'
-                status_color = '#dc3545'
-            else:
-                status_class = 'status-competitive'
-                status_color = '#ffc107'
-            
-            st.markdown(f"""
+            constituency_rows.append(f"""
             <div class="eci-party-row">
                 <div>
                     <div class="eci-party-name">{name}</div>
@@ -591,7 +714,9 @@ class OfficialStyleDashboard:
                     <div class="{status_class}">{status}</div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        
+        st.markdown("\n".join(constituency_rows), unsafe_allow_html=True)
     
     def render_live_updates(self):
         """Render live updates section"""
@@ -603,41 +728,7 @@ class OfficialStyleDashboard:
         </div>
         """, unsafe_allow_html=True)
         
-        # Sample forecast updates
-        updates = [
-            {
-                'time': '14:30',
-                'update': 'Monte Carlo simulation updated with latest poll data - NDA projected 125 seats'
-            },
-            {
-                'time': '14:15', 
-                'update': 'Model identifies 35 highly competitive constituencies with <55% win probability'
-            },
-            {
-                'time': '14:00',
-                'update': 'Sentiment analysis shows INDI alliance gaining momentum in Seemanchal region'
-            },
-            {
-                'time': '13:45',
-                'update': 'Feature engineering complete: BJP forecast 69 seats, RJD 68 seats'
-            },
-            {
-                'time': '13:30',
-                'update': 'News sentiment data integrated into forecasting model'
-            }
-        ]
-        
-        for update in updates:
-            st.markdown(f"""
-            <div class="eci-party-row">
-                <div>
-                    <div style="font-weight: bold; color: #1f4e79;">{update['time']}</div>
-                </div>
-                <div style="flex: 1; padding-left: 1rem;">
-                    {update['update']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(LIVE_UPDATES_HTML, unsafe_allow_html=True)
     
     def render_seat_distribution_pie_chart(self, summary):
         """Render seat distribution pie chart in ECI style"""
@@ -662,46 +753,7 @@ class OfficialStyleDashboard:
         </div>
         """, unsafe_allow_html=True)
         
-        # Create pie chart
-        labels = ['NDA', 'INDI', 'Others']
-        values = [nda_seats, indi_seats, others_seats]
-        colors = ['#FF9933', '#19AAED', '#808080']
-        
-        fig = go.Figure(data=[go.Pie(
-            labels=labels, 
-            values=values, 
-            marker_colors=colors,
-            hole=0.4,
-            textinfo='label+percent+value',
-            textfont_size=16,
-            textfont_color='white',
-            textposition='auto',
-            marker=dict(
-                colors=colors,
-                line=dict(color='white', width=3)
-            )
-        )])
-        
-        fig.update_layout(
-            title={
-                'text': "Projected Seat Distribution",
-                'x': 0.5,
-                'xanchor': 'center',
-                'font': {'size': 18, 'color': '#1f4e79'}
-            },
-            height=400,
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.2,
-                xanchor="center",
-                x=0.5
-            ),
-            font=dict(size=12)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_seat_pie(nda_seats, indi_seats, others_seats), use_container_width=True)
         
         # Add majority line indicator
         st.markdown(f"""
@@ -727,32 +779,27 @@ class OfficialStyleDashboard:
         
         # Generate sample constituency data if not available
         if const_prob_df is None or const_prob_df.empty:
-            # Create sample data for Bihar constituencies
-            constituencies = []
-            regions = ['Patna', 'Gaya', 'Muzaffarpur', 'Darbhanga', 'Bhagalpur', 'Purnia', 'Kishanganj', 'Araria']
-            
-            for i in range(243):
-                region = regions[i % len(regions)]
-                nda_prob = np.random.uniform(0.2, 0.8)
-                
-                constituencies.append({
-                    'constituency': f'Constituency_{i+1}',
-                    'region': region,
-                    'nda_win_probability': nda_prob,
-                    'predicted_winner': 'NDA' if nda_prob > 0.5 else 'INDI',
-                    'x_coord': (i % 20) * 2,  # Simple grid layout
-                    'y_coord': (i // 20) * 2
-                })
+            # Create sample data for Bihar constituencies, one column at a time
+            regions = np.array(['Patna', 'Gaya', 'Muzaffarpur', 'Darbhanga', 'Bhagalpur', 'Purnia', 'Kishanganj', 'Araria'])
+            idx = np.arange(243)
+            nda_prob = np.random.uniform(0.2, 0.8, len(idx))
             
-            const_prob_df = pd.DataFrame(constituencies)
+            const_prob_df = pd.DataFrame({
+                'constituency': [f'Constituency_{i+1}' for i in idx],
+                'region': regions[idx % len(regions)],
+                'nda_win_probability': nda_prob,
+                'predicted_winner': np.where(nda_prob > 0.5, 'NDA', 'INDI'),
+                'x_coord': (idx % 20) * 2,  # Simple grid layout
+                'y_coord': (idx // 20) * 2
+            })
         else:
             # Add coordinates for existing data (simple grid layout)
-            const_prob_df = const_prob_df.copy()
-            const_prob_df['predicted_winner'] = const_prob_df['nda_win_probability'].apply(
-                lambda x: 'NDA' if x > 0.5 else 'INDI'
+            idx = np.arange(len(const_prob_df))
+            const_prob_df = const_prob_df.assign(
+                predicted_winner=np.where(const_prob_df['nda_win_probability'].to_numpy() > 0.5, 'NDA', 'INDI'),
+                x_coord=(idx % 20) * 2,
+                y_coord=(idx // 20) * 2
             )
-            const_prob_df['x_coord'] = [(i % 20) * 2 for i in range(len(const_prob_df))]
-            const_prob_df['y_coord'] = [(i // 20) * 2 for i in range(len(const_prob_df))]
         
         # Create constituency map visualization
         fig = go.Figure()
@@ -767,7 +814,7 @@ class OfficialStyleDashboard:
         for winner in ['NDA', 'INDI']:
             winner_data = const_prob_df[const_prob_df['predicted_winner'] == winner]
             
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=winner_data['x_coord'],
                 y=winner_data['y_coord'],
                 mode='markers',
@@ -964,7 +1011,6 @@ class OfficialStyleDashboard:
             self.render_constituency_details_eci(const_prob_df)
         
         with tab5:
-            # Live updates
             self.render_live_updates()
         
         # Footer
@@ -2,6 +2,8 @@
 Bihar Political Parties and Candidate Database
 """
 
+import numpy as np
+
 # Major Bihar Political Parties
 BIHAR_PARTIES = {
     # NDA Alliance
@@ -136,6 +138,10 @@ NDA_PARTIES = ['BJP', 'JDU', 'HAM', 'VIP']
 INDI_PARTIES = ['RJD', 'INC', 'CPI_ML']
 OTHER_PARTIES = ['AIMIM', 'BSP', 'LJSP', 'LJPRV', 'RLSP', 'AAP', 'NOTA']
 
+# Simplified share of each alliance's seats won by its parties (aligned with the lists above)
+NDA_SHARES = np.array([0.55, 0.35, 0.05, 0.05], dtype=np.float32)
+INDI_SHARES = np.array([0.60, 0.25, 0.05], dtype=np.float32)
+
 def get_party_alliance(party_code):
     """Get alliance for a party"""
     if party_code in NDA_PARTIES:
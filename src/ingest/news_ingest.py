@@ -6,7 +6,7 @@ import json
 from bs4 import BeautifulSoup
 import feedparser
 import re
-from src.config.settings import Config
+from src.config.settings import Config, build_keyword_matcher
 
 
 class NewsIngestor:
@@ -205,6 +205,7 @@ class NewsIngestor:
             'assembly', 'विधानसभा', 'rjd', 'jdu', 'bjp', 'congress', 'patna', 'पटना',
             'rally', 'रैली', 'campaign', 'प्रचार', 'candidate', 'उम्मीदवार', 'alliance', 'गठबंधन'
         ]
+        match_bihar_keywords = build_keyword_matcher(bihar_keywords)
         
         for source_name, urls in news_sources.items():
             for url in urls:
@@ -239,8 +240,7 @@ class NewsIngestor:
                             
                             # Enhanced filtering with both English and Hindi keywords
                             if title and len(title) > 15:
-                                title_lower = title.lower()
-                                if any(keyword.lower() in title_lower for keyword in bihar_keywords):
+                                if match_bihar_keywords(title):
                                     # Build full URL
                                     if href.startswith('http'):
                                         full_url = href
@@ -334,6 +334,7 @@ class NewsIngestor:
             'bihar', 'बिहार', 'nitish', 'नीतीश', 'tejashwi', 'तेजस्वी', 'patna', 'पटना',
             'election', 'चुनाव', 'assembly', 'विधानसभा', 'rjd', 'jdu', 'bjp', 'congress'
         ]
+        match_bihar_keywords = build_keyword_matcher(bihar_filter_keywords)
         
         for source_name, rss_url in rss_feeds.items():
             try:
@@ -350,8 +351,7 @@ class NewsIngestor:
                         published = entry.get('published', datetime.now().isoformat())
                         
                         # Filter for Bihar-related content
-                        content_text = f"{title} {description}".lower()
-                        if any(keyword.lower() in content_text for keyword in bihar_filter_keywords):
+                        if match_bihar_keywords(f"{title} {description}"):
                             
                             # Clean HTML from description
                             if description:
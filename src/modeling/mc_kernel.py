@@ -0,0 +1,104 @@
+import numpy as np
+from typing import Tuple
+
+# Try to import numba for the compiled kernel, fall back to plain Python loops
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Warning: numba not available. Monte Carlo kernel will run uncompiled.")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+
+# Fixed number of RNG streams / counter blocks, independent of the thread count
+# so a seed reproduces the same simulations on any host
+N_CHUNKS = 64
+
+
+def _n_chunks(n_sims: int) -> int:
+    """Number of independent RNG streams / counter blocks to split the run into"""
+    return max(1, min(N_CHUNKS, n_sims))
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _simulate_kernel(base_logits, region_codes, n_regions, volatility, n_sims, n_chunks,
+                     seed, uncertainty_factor, correlation_factor):
+    """Fused shock + threshold + seat count kernel.
+
+    Each chunk owns its own RNG seed and win counter row, so no state is
+    shared between threads. The chunk count is fixed rather than taken from
+    the thread count, so results depend only on the seed and n_sims.
+    """
+    n_constituencies = base_logits.shape[0]
+    nda_seats = np.zeros(n_sims, dtype=np.int16)
+    win_counts = np.zeros((n_chunks, n_constituencies), dtype=np.int32)
+    chunk_size = (n_sims + n_chunks - 1) // n_chunks
+
+    for c in prange(n_chunks):
+        np.random.seed(seed + c)
+        regional_shocks = np.empty(n_regions)
+        start = c * chunk_size
+        end = min(start + chunk_size, n_sims)
+
+        for s in range(start, end):
+            # Correlated shocks: 1% national, 2% regional
+            national_shock = np.random.normal(0.0, 0.01)
+            for r in range(n_regions):
+                regional_shocks[r] = np.random.normal(0.0, 0.02)
+
+            seats = 0
+            for i in range(n_constituencies):
+                total_shock = (
+                    national_shock +
+                    regional_shocks[region_codes[i]] * correlation_factor +
+                    np.random.normal(0.0, volatility[i] / 100) * uncertainty_factor
+                )
+
+                # Apply shock in logit space and keep probability in bounds
+                prob = 1.0 / (1.0 + np.exp(-(base_logits[i] + total_shock * 5)))
+                prob = min(max(prob, 0.001), 0.999)
+
+                if np.random.random() < prob:
+                    seats += 1
+                    win_counts[c, i] += 1
+
+            nda_seats[s] = seats
+
+    return nda_seats, win_counts.sum(axis=0)
+
+
+def simulate(p_matrix: np.ndarray, n_sims: int, seed: int, region_codes: np.ndarray = None,
+             volatility: np.ndarray = None, uncertainty_factor: float = 1.0,
+             correlation_factor: float = 0.3) -> Tuple[np.ndarray, np.ndarray]:
+    """Run n_sims elections over per-constituency NDA win probabilities.
+
+    Returns (nda_seats, constituency_wins): NDA seat total per simulation and
+    the number of simulations each constituency was won by NDA.
+    """
+    probs = np.clip(np.asarray(p_matrix, dtype=np.float64), 0.001, 0.999)
+    n_constituencies = len(probs)
+
+    if region_codes is None:
+        region_codes = np.zeros(n_constituencies, dtype=np.int64)
+    if volatility is None:
+        volatility = np.full(n_constituencies, 2.5)
+
+    # Normalise dtypes so every call hits the same cached specialisation
+    region_codes = np.ascontiguousarray(region_codes, dtype=np.int64)
+    volatility = np.ascontiguousarray(volatility, dtype=np.float64)
+    n_regions = int(region_codes.max()) + 1 if n_constituencies else 1
+
+    return _simulate_kernel(
+        np.log(probs / (1 - probs)), region_codes, n_regions, volatility,
+        int(n_sims), _n_chunks(int(n_sims)), int(seed),
+        float(uncertainty_factor), float(correlation_factor)
+    )
@@ -4,10 +4,9 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from src.config.settings import Config
-import json
+from src.utils.fast_json import write_json
 from scipy import stats
-from concurrent.futures import ProcessPoolExecutor
-import multiprocessing as mp
+from src.modeling.mc_kernel import simulate, NUMBA_AVAILABLE
 
 
 class MonteCarloSimulator:
@@ -87,43 +86,28 @@ class MonteCarloSimulator:
     
     def _run_parallel_simulations(self, n_sims: int, uncertainty_factor: float, 
                                  correlation_factor: float) -> Dict:
-        """Run simulations in parallel for better performance"""
-        n_cores = min(mp.cpu_count(), 8)  # Limit to 8 cores
-        sims_per_core = n_sims // n_cores
-        
-        print(f"   Running on {n_cores} cores ({sims_per_core:,} sims per core)")
-        
-        # Prepare arguments for parallel execution
-        args_list = []
-        for i in range(n_cores):
-            start_sim = i * sims_per_core
-            end_sim = (i + 1) * sims_per_core if i < n_cores - 1 else n_sims
-            n_core_sims = end_sim - start_sim
-            
-            args_list.append((
-                n_core_sims, 
-                self.base_probs, 
-                self.features_df, 
-                uncertainty_factor, 
-                correlation_factor,
-                i  # seed offset
-            ))
-        
-        # Run parallel simulations
-        with ProcessPoolExecutor(max_workers=n_cores) as executor:
-            core_results = list(executor.map(self._simulate_batch, args_list))
-        
-        # Combine results
-        all_nda_seats = []
-        all_constituency_wins = []
-        
-        for core_result in core_results:
-            all_nda_seats.extend(core_result['nda_seats'])
-            all_constituency_wins.extend(core_result['constituency_wins'])
+        """Run simulations through the compiled multi-core kernel"""
+        if not NUMBA_AVAILABLE:
+            return self._run_sequential_simulations(n_sims, uncertainty_factor, correlation_factor)
+        
+        print(f"   Running compiled Monte Carlo kernel across all cores")
+        
+        n_constituencies = len(self.base_probs)
+        volatility = self.features_df.get('poll_volatility', pd.Series([2.5] * n_constituencies)).values
+        regions = self.features_df['region'].values if 'region' in self.features_df.columns else ['Unknown'] * n_constituencies
+        region_codes, _ = pd.factorize(pd.Series(regions))
+        
+        nda_seats, constituency_wins = simulate(
+            self.base_probs, n_sims, 42,
+            region_codes=region_codes,
+            volatility=volatility,
+            uncertainty_factor=uncertainty_factor,
+            correlation_factor=correlation_factor
+        )
         
         return {
-            'nda_seats': np.array(all_nda_seats),
-            'constituency_wins': np.array(all_constituency_wins)
+            'nda_seats': nda_seats,
+            'constituency_wins': constituency_wins
         }
     
     def _run_sequential_simulations(self, n_sims: int, uncertainty_factor: float, 
@@ -138,61 +122,48 @@ class MonteCarloSimulator:
         n_sims, base_probs, features_df, uncertainty_factor, correlation_factor, seed_offset = args
         
         # Set random seed for reproducibility
-        np.random.seed(42 + seed_offset)
+        rng = np.random.default_rng(42 + seed_offset)
         
         n_constituencies = len(base_probs)
-        nda_seats = []
-        constituency_wins = []
         
         # Get uncertainty measures
         volatility = features_df.get('poll_volatility', pd.Series([2.5] * n_constituencies)).values
-        uncertainty = features_df.get('poll_uncertainty', pd.Series([5.0] * n_constituencies)).values
         
         # Regional correlation matrix (simplified)
         regions = features_df['region'].values if 'region' in features_df.columns else ['Unknown'] * n_constituencies
-        unique_regions = list(set(regions))
-        region_indices = {region: i for i, region in enumerate(unique_regions)}
+        region_codes, unique_regions = pd.factorize(pd.Series(regions))
+        
+        # Draw every shock for the whole batch at once: (n_sims, n_regions) regional,
+        # (n_sims, 1) national and (n_sims, n_constituencies) local noise
+        regional_shocks = rng.normal(0, 0.02, (n_sims, len(unique_regions)))  # 2% regional shock
+        national_shock = rng.normal(0, 0.01, (n_sims, 1))  # 1% national shock
+        local_shocks = rng.normal(0, volatility / 100, (n_sims, n_constituencies))
+        
+        total_shock = (
+            national_shock +
+            regional_shocks[:, region_codes] * correlation_factor +
+            local_shocks * uncertainty_factor
+        )
         
-        for sim in range(n_sims):
-            # Generate correlated random shocks
-            regional_shocks = np.random.normal(0, 0.02, len(unique_regions))  # 2% regional shock
-            national_shock = np.random.normal(0, 0.01)  # 1% national shock
-            
-            # Apply shocks to each constituency
-            sim_probs = base_probs.copy()
-            
-            for i, region in enumerate(regions):
-                region_idx = region_indices.get(region, 0)
-                
-                # Combine shocks
-                total_shock = (
-                    national_shock + 
-                    regional_shocks[region_idx] * correlation_factor +
-                    np.random.normal(0, volatility[i] / 100) * uncertainty_factor
-                )
-                
-                # Apply shock to probability (logit space for better behavior)
-                logit_prob = np.log(sim_probs[i] / (1 - sim_probs[i]))
-                logit_prob += total_shock * 5  # Scale shock
-                sim_probs[i] = 1 / (1 + np.exp(-logit_prob))
-            
-            # Ensure probabilities stay in bounds
-            sim_probs = np.clip(sim_probs, 0.001, 0.999)
-            
-            # Simulate election outcomes
-            wins = np.random.random(n_constituencies) < sim_probs
-            constituency_wins.append(wins.astype(int))
-            nda_seats.append(wins.sum())
+        # Apply shock to probability (logit space for better behavior)
+        base_logits = np.log(base_probs / (1 - base_probs))
+        sim_probs = 1 / (1 + np.exp(-(base_logits + total_shock * 5)))  # Scale shock
+        
+        # Ensure probabilities stay in bounds
+        sim_probs = np.clip(sim_probs, 0.001, 0.999).astype(np.float32)
+        
+        # Simulate election outcomes
+        wins = rng.random((n_sims, n_constituencies), dtype=np.float32) < sim_probs
         
         return {
-            'nda_seats': nda_seats,
-            'constituency_wins': constituency_wins
+            'nda_seats': wins.sum(axis=1, dtype=np.int16),
+            'constituency_wins': wins.sum(axis=0, dtype=np.int32)
         }
     
     def _calculate_simulation_statistics(self, results: Dict) -> Dict:
         """Calculate comprehensive statistics from simulation results"""
-        nda_seats = results['nda_seats']
-        constituency_wins = np.array(results['constituency_wins'])
+        nda_seats = np.asarray(results['nda_seats'])
+        constituency_wins = np.asarray(results['constituency_wins'])  # per-constituency win counts
         
         # Basic statistics
         stats = {
@@ -215,7 +186,7 @@ class MonteCarloSimulator:
         stats['prob_hung_assembly'] = float(np.mean((nda_seats >= 110) & (nda_seats < 134)))
         
         # Constituency-level statistics
-        constituency_win_probs = np.mean(constituency_wins, axis=0)
+        constituency_win_probs = constituency_wins / len(nda_seats)
         stats['constituency_win_probabilities'] = constituency_win_probs.tolist()
         
         # Seat classification
@@ -377,8 +348,7 @@ class MonteCarloSimulator:
         
         # Export summary statistics
         summary_file = output_path / "simulation_summary.json"
-        with open(summary_file, 'w') as f:
-            json.dump(results['statistics'], f, indent=2)
+        write_json(summary_file, results['statistics'])
         exported_files['summary'] = str(summary_file)
         
         # Export marginal seats
@@ -397,12 +367,11 @@ class MonteCarloSimulator:
         # Export raw simulation data (sample)
         sample_size = min(1000, len(results['simulation_results']['nda_seats']))
         sample_data = {
-            'nda_seats': results['simulation_results']['nda_seats'][:sample_size].tolist(),
+            'nda_seats': results['simulation_results']['nda_seats'][:sample_size],
             'metadata': results['metadata']
         }
         raw_file = output_path / "simulation_sample.json"
-        with open(raw_file, 'w') as f:
-            json.dump(sample_data, f, indent=2, default=str)
+        write_json(raw_file, sample_data)
         exported_files['simulation_sample'] = str(raw_file)
         
         print(f"✅ Exported simulation results to {output_path}")
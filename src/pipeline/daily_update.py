@@ -1,9 +1,10 @@
+import os
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from src.config.settings import Config
-import json
+from src.utils.fast_json import read_json, write_json
 import traceback
 import logging
 
@@ -151,6 +152,8 @@ class DailyUpdatePipeline:
         
         # Save pipeline results
         self._save_pipeline_results(pipeline_results)
+        self._update_data_manifest()
+        self._update_forecast_history()
         
         return pipeline_results
     
@@ -217,8 +220,7 @@ class DailyUpdatePipeline:
             if eci_trends:
                 # Save ECI trends data
                 trends_path = Config.RAW_DATA_DIR / f"eci_trends_{self.date_str}.json"
-                with open(trends_path, 'w') as f:
-                    json.dump(eci_trends, f, indent=2, default=str)
+                write_json(trends_path, eci_trends)
                 self.logger.info(f"   ✅ Saved ECI real-time trends data")
             
             # Data freshness check
@@ -521,8 +523,7 @@ class DailyUpdatePipeline:
             # Save summary
             results_dir = Config.RESULTS_DIR / self.date_str
             summary_path = results_dir / "forecast_summary.json"
-            with open(summary_path, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            write_json(summary_path, summary)
             
             results['summary_statistics'] = summary
             results['reports_generated'] = 1
@@ -702,11 +703,77 @@ class DailyUpdatePipeline:
         
         # Save to file
         summary_path = results_dir / "pipeline_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(pipeline_summary, f, indent=2, default=str)
+        write_json(summary_path, pipeline_summary)
         
         self.logger.info(f"Pipeline results saved to {results_dir}")
     
+    def _update_data_manifest(self):
+        """Record today's processed data files in PROCESSED_DATA_DIR/manifest.json for the dashboard"""
+        try:
+            manifest_path = Config.PROCESSED_DATA_DIR / "manifest.json"
+            manifest = read_json(manifest_path) if manifest_path.exists() else {}
+            
+            entry = {'news': [], 'polls': [], 'features': []}
+            with os.scandir(Config.PROCESSED_DATA_DIR) as entries:
+                for file_entry in entries:
+                    file_name = file_entry.name
+                    if self.date_str not in file_name or not file_entry.is_file():
+                        continue
+                    
+                    if 'news' in file_name:
+                        entry['news'].append(file_name)
+                    if 'poll' in file_name:
+                        entry['polls'].append(file_name)
+                    if file_name.startswith('features'):
+                        entry['features'].append(file_name)
+            
+            manifest[self.date_str] = entry
+            write_json(manifest_path, manifest)
+            
+        except Exception as e:
+            self.logger.warning(f"Could not update data manifest: {e}")
+    
+    def _update_forecast_history(self):
+        """Append forecasts not yet in RESULTS_DIR/historical.parquet, which backs the dashboard's history charts"""
+        try:
+            history_path = Config.RESULTS_DIR / "historical.parquet"
+            columns = ['date', 'mean_seats', 'prob_majority']
+            history = pd.DataFrame(columns=columns).astype({'mean_seats': float, 'prob_majority': float})
+            if history_path.exists():
+                history = pd.read_parquet(history_path, columns=columns)
+            
+            # Only newer dates are read, plus the newest recorded date in case that day's forecast was rerun
+            last_recorded = history['date'].max() if not history.empty else ''
+            with os.scandir(Config.RESULTS_DIR) as entries:
+                date_names = sorted(e.name for e in entries if e.is_dir() and e.name >= last_recorded)
+            
+            summaries = []
+            for name in date_names:
+                summary_path = Config.RESULTS_DIR / name / "forecast_summary.json"
+                if not summary_path.exists():
+                    continue
+                summary = read_json(summary_path)
+                summary['date'] = name
+                summaries.append(summary)
+            
+            if not summaries:
+                return
+            
+            # Flatten nda_projection into native float columns in one pass
+            new_rows = pd.json_normalize(summaries).rename(columns={
+                'nda_projection.mean_seats': 'mean_seats',
+                'nda_projection.probability_majority': 'prob_majority'
+            }).reindex(columns=columns).fillna(0)
+            history = pd.concat([history[~history['date'].isin(new_rows['date'])], new_rows], ignore_index=True)
+            
+            # Write then rename so the dashboard never reads a partial file
+            tmp_path = history_path.with_suffix('.tmp')
+            history.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, history_path)
+            
+        except Exception as e:
+            self.logger.warning(f"Could not update forecast history: {e}")
+    
     def run_quick_update(self) -> Dict:
         """Run a quick update with minimal processing"""
         self.logger.info("Running quick update pipeline...")
@@ -1,4 +1,4 @@
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -10,6 +10,8 @@ from src.pipeline.daily_update import DailyUpdatePipeline
 import logging
 import json
 import traceback
+import asyncio
+import functools
 import signal
 import sys
 
@@ -20,11 +22,11 @@ class ForecastScheduler:
     def __init__(self, background_mode: bool = False):
         self.background_mode = background_mode
         
-        # Initialize scheduler
+        # Initialize scheduler (foreground mode runs jobs on an asyncio event loop)
         if background_mode:
             self.scheduler = BackgroundScheduler()
         else:
-            self.scheduler = BlockingScheduler()
+            self.scheduler = AsyncIOScheduler()
         
         # Setup logging
         self._setup_logging()
@@ -77,13 +79,23 @@ class ForecastScheduler:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
     
+    def _job(self, func: Callable) -> Callable:
+        """Wrap a blocking job body as a coroutine when running on the asyncio scheduler"""
+        if self.background_mode:
+            return func
+        return functools.partial(self._run_in_thread, func)
+    
+    async def _run_in_thread(self, func: Callable):
+        """Run a blocking job off the event loop so other scheduled jobs can overlap"""
+        await asyncio.to_thread(func)
+    
     def add_daily_forecast_job(self, hour: int = None, minute: int = 0, timezone: str = 'Asia/Kolkata'):
         """Add daily forecast update job"""
         if hour is None:
             hour = Config.DAILY_UPDATE_HOUR
         
         self.scheduler.add_job(
-            func=self._run_daily_forecast,
+            func=self._job(self._run_daily_forecast),
             trigger=CronTrigger(hour=hour, minute=minute, timezone=timezone),
             id='daily_forecast_update',
             name='Daily Bihar Forecast Update',
@@ -97,7 +109,7 @@ class ForecastScheduler:
     def add_quick_update_job(self, interval_hours: int = 4):
         """Add quick update job that runs every few hours"""
         self.scheduler.add_job(
-            func=self._run_quick_update,
+            func=self._job(self._run_quick_update),
             trigger=IntervalTrigger(hours=interval_hours),
             id='quick_update',
             name='Quick Forecast Update',
@@ -110,7 +122,7 @@ class ForecastScheduler:
     def add_data_monitoring_job(self, interval_minutes: int = 30):
         """Add data source monitoring job"""
         self.scheduler.add_job(
-            func=self._monitor_data_sources,
+            func=self._job(self._monitor_data_sources),
             trigger=IntervalTrigger(minutes=interval_minutes),
             id='data_monitoring',
             name='Data Source Monitoring',
@@ -123,7 +135,7 @@ class ForecastScheduler:
     def add_cleanup_job(self, hour: int = 2, minute: int = 0):
         """Add daily cleanup job"""
         self.scheduler.add_job(
-            func=self._run_cleanup,
+            func=self._job(self._run_cleanup),
             trigger=CronTrigger(hour=hour, minute=minute),
             id='daily_cleanup',
             name='Daily Cleanup',
@@ -389,11 +401,21 @@ class ForecastScheduler:
             self.logger.info(f"    Next run: {job.next_run_time}")
         
         try:
-            self.scheduler.start()
+            if self.background_mode:
+                self.scheduler.start()
+            else:
+                asyncio.run(self._run_event_loop())
         except KeyboardInterrupt:
             self.logger.info("Scheduler interrupted by user")
             self.shutdown()
     
+    async def _run_event_loop(self):
+        """Start the asyncio scheduler and keep the loop alive until shutdown"""
+        self.scheduler.start()
+        
+        while self.scheduler.running:
+            await asyncio.sleep(5)
+    
     def shutdown(self):
         """Gracefully shutdown the scheduler"""
         self.logger.info("Shutting down scheduler...")
@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+from typing import Any, Union
+
+# Try to import orjson for faster (de)serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize NumPy arrays/scalars as lists/numbers and anything else as a string"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj to JSON bytes, writing NumPy arrays without a .tolist() copy under orjson"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode()
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file in one binary read"""
+    return loads(Path(path).read_bytes())
+
+
+def write_json(path: Union[str, Path], obj: Any, indent: bool = True):
+    """Serialize obj and write it to path"""
+    Path(path).write_bytes(dumps(obj, indent=indent))
@@ -313,7 +313,7 @@ class HealthChecker:
             api_status = {}
             
             # Check NewsAPI if key is available
-            news_api_key = os.getenv('NEWS_API_KEY')
+            news_api_key = Config.NEWS_API_KEY
             if news_api_key and news_api_key != 'your_newsapi_key_here':
                 try:
                     response = requests.get(